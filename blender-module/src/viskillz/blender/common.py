@@ -1,12 +1,13 @@
 import math
-from typing import List, Tuple, Sequence, cast
+from typing import Dict, List, Tuple, Sequence, cast
 
 import bmesh
 import bpy
 import mathutils
+import numpy as np
 from mathutils import Matrix
-from viskillz.blender.constants import COLLECTION_PERMUTATIONS
-from viskillz.blender.scene import hide_object, show_object, delete_object, duplicate_object
+from viskillz.blender.constants import COLLECTION_PERMUTATIONS, rotation_vectors, scale_vectors, get_scaled_name
+from viskillz.blender.scene import hide_object, show_object, delete_object, duplicate_object, state
 
 
 def contour_edges(obj: bpy.types.Object) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
@@ -52,22 +53,17 @@ def scale_object(obj: bpy.types.Object,
     :return: IDs of the scaled objects
     """
 
-    o = 1
-    s = factor
-
-    vectors = [
-        [o, o, o], [s, o, o], [o, s, o], [o, o, s],
-        [s, s, o], [s, o, s], [o, s, s]
-    ]
-
     names = []
-    for vector in vectors:
+    for vector in scale_vectors(factor):
         scaled_name = duplicate_object(obj.name,
-                                       copy_name=obj.name + "." + "".join("1" if c == s else "0" for c in vector),
+                                       copy_name=get_scaled_name(obj.name, vector),
                                        copy_collection=COLLECTION_PERMUTATIONS)
         scaled = bpy.data.objects[scaled_name]
         scale_object_vec(scaled, vector)
         names.append(scaled_name)
+
+    state.update()
+    for scaled_name in names:
         hide_object(scaled_name)
     return names
 
@@ -97,8 +93,92 @@ def create_answer(shape_name: str,
 
     #####
     init_object(intersection, rotation)
-    bpy.context.view_layer.update()
+    state.update()
     bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+    return cut_object(intersection, original_co, original_no, diff, ratio_value)
+
+
+def create_base(shape_name: str,
+                rotation: Sequence[float]) -> bpy.types.Object:
+    """
+    Creates the rotated copy of a shape, from which the intersections of all the planes can be derived by
+    create_section. Its FreeStyle edges are cleared and its rotation is applied, like in create_answer.
+    :param shape_name: the name of the shape
+    :param rotation: the rotation vector
+    :return: the rotated copy, which is hidden
+    """
+    try:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    except RuntimeError:
+        pass
+
+    if "base" in bpy.data.objects:
+        delete_object("base")
+
+    base_name = duplicate_object(shape_name, copy_name="base", copy_collection=COLLECTION_PERMUTATIONS)
+    bpy.ops.object.select_all(action='DESELECT')
+    base = bpy.data.objects[base_name]
+    show_object(base_name)
+    base.select_set(True)
+    bpy.context.view_layer.objects.active = base
+
+    clear_freestyle_edges(base)
+    init_object(base, rotation)
+    state.update()
+    bpy.ops.object.transform_apply(location=False, rotation=True, scale=False)
+    hide_object(base_name)
+    return base
+
+
+def create_section(base_name: str,
+                   original_co,
+                   original_no,
+                   diff: Tuple[float, float, float] = (0, 0, 0),
+                   ratio_value: float = 2.0):
+    """
+    Creates the intersection of a rotated copy of create_base with a plane, performing the same steps on a duplicate
+    as create_answer does after applying the rotation.
+    :param base_name: the name of the rotated copy
+    :param original_co: the pivot coordinate of the plane
+    :param original_no: the normal vector of the plane
+    :param diff: the rotation vector of the plane
+    :param ratio_value: the scaling factor
+    :return: the intersection
+    """
+    try:
+        bpy.ops.object.mode_set(mode="OBJECT")
+    except RuntimeError:
+        pass
+
+    if "foo" in bpy.data.objects:
+        delete_object("foo")
+
+    intersection_name = duplicate_object(base_name, copy_name="foo")
+    bpy.ops.object.select_all(action='DESELECT')
+    intersection = bpy.data.objects[intersection_name]
+    show_object(intersection_name)
+    intersection.select_set(True)
+    bpy.context.view_layer.objects.active = intersection
+    state.update()
+
+    return cut_object(intersection, original_co, original_no, diff, ratio_value)
+
+
+def cut_object(intersection: bpy.types.Object,
+               original_co,
+               original_no,
+               diff: Tuple[float, float, float] = (0, 0, 0),
+               ratio_value: float = 2.0) -> bpy.types.Object:
+    """
+    Bisects the active, rotated object with a plane, then rotates, moves and scales the contour in front of the camera.
+    These are the common last steps of create_answer and create_section.
+    :param intersection: the object, which is modified in place
+    :param original_co: the pivot coordinate of the plane
+    :param original_no: the normal vector of the plane
+    :param diff: the rotation vector of the plane
+    :param ratio_value: the scaling factor
+    :return: the intersection
+    """
     intersection.scale = (ratio_value, ratio_value, ratio_value)
     co = intersection.matrix_world.inverted() @ mathutils.Vector(original_co)
     no = intersection.matrix_world.inverted() @ mathutils.Vector(original_no)
@@ -122,9 +202,88 @@ def create_answer(shape_name: str,
     return intersection
 
 
-def get_case_id(frame_name: str,
-                rotation: List[float]) -> str:
-    return frame_name[1:] + "." + str(rotation[0] // 90) + str(rotation[1] // 90) + str(rotation[2] // 90)
+def half_turn_pairs(rotations: List[List[float]],
+                    plane: List[Tuple[float, float, float]],
+                    tolerance: float = 1e-6) -> Dict[int, int]:
+    """
+    Pairs the rotations that differ by a half turn around the normal vector of a plane. The plane is invariant under
+    such a half turn, thus the intersection of the second rotation is the one of the first rotation turned by a half
+    turn within the plane. If the plane's own rotation maps its normal vector onto axis Z, the contour of the second
+    one is the contour of the first one with negated coordinates.
+    :param rotations: the rotation vectors
+    :param plane: the pivot coordinate, the normal vector and the rotation vector of the plane
+    :param tolerance: the tolerance of the comparison of the matrices
+    :return: the index of the first rotation for the index of each second rotation, or nothing if the plane's own
+        rotation does not map its normal vector onto axis Z
+    """
+    normal = np.array(plane[1], dtype=float)
+    normal /= np.linalg.norm(normal)
+    if np.abs(np.abs(np.array(rotation_matrix(plane[2])) @ normal) - [0, 0, 1]).max() > tolerance:
+        return dict()
+
+    half_turn = 2 * np.outer(normal, normal) - np.eye(3)
+    matrices = np.array([rotation_matrix(rotation) for rotation in rotations])
+    pairs = dict()
+    for i, matrix in enumerate(matrices):
+        matches = np.flatnonzero(np.abs(matrices - half_turn @ matrix).max(axis=(1, 2)) < tolerance)
+        if len(matches) > 0 and matches[0] < i:
+            pairs[i] = int(matches[0])
+    return pairs
+
+
+def empty_sections(obj: bpy.types.Object,
+                   rotations: List[List[float]],
+                   planes: List[List[Tuple[float, float, float]]],
+                   ratio_value: float = 2.0,
+                   threshold: float = 0.0001) -> np.ndarray:
+    """
+    Determines which intersections of create_answer are surely empty, without duplicating the object.
+    The vertices are rotated and scaled like in create_answer, then their signed distances to all the planes are
+    calculated in a single vectorized operation. An intersection is empty if all the vertices are on the same side
+    of the plane, farther than the threshold.
+    :param obj: the object
+    :param rotations: the rotation vectors
+    :param planes: the vectors of the planes
+    :param ratio_value: the scaling factor
+    :param threshold: the minimal distance of the vertices in local coordinates
+    :return: a boolean matrix, having a row for each rotation and a column for each plane
+    """
+    co = np.empty(len(obj.data.vertices) * 3)
+    obj.data.vertices.foreach_get("co", co)
+    co = co.reshape((-1, 3))
+
+    matrices = np.array([rotation_matrix(rotation) for rotation in rotations])
+    normals = np.array([plane[1] for plane in planes], dtype=float)
+    offsets = np.einsum("pi,pi->p", np.array([plane[0] for plane in planes], dtype=float), normals)
+
+    distances = np.einsum("rij,nj,pi->rnp", matrices, co, normals) * ratio_value - offsets
+    margin = threshold * ratio_value * np.linalg.norm(normals, axis=1)
+    return np.all(distances > margin, axis=1) | np.all(distances < -margin, axis=1)
+
+
+def euler_matrix(rotation: Sequence[float]) -> Matrix:
+    """
+    Calculates the matrix of an Euler rotation with ZYX order.
+    :param rotation: the rotation vector
+    :return: the rotation matrix
+    """
+    return Matrix.Rotation(math.radians(rotation[0]), 3, "X") @ \
+        Matrix.Rotation(math.radians(rotation[1]), 3, "Y") @ \
+        Matrix.Rotation(math.radians(rotation[2]), 3, "Z")
+
+
+ROTATION_MATRICES = {tuple(rotation): euler_matrix(rotation) for rotation in rotation_vectors()}
+
+
+def rotation_matrix(rotation: Sequence[float]) -> Matrix:
+    """
+    Returns the matrix of an Euler rotation with ZYX order, as applied by rotate_global.
+    The matrices of the 24 unique rotations are precomputed.
+    :param rotation: the rotation vector
+    :return: the rotation matrix
+    """
+    matrix = ROTATION_MATRICES.get(tuple(rotation))
+    return matrix.copy() if matrix is not None else euler_matrix(rotation)
 
 
 def scale_object_vec(obj, ratio):
@@ -262,27 +421,24 @@ def rotate_global(obj: bpy.types.Object,
                   rotation: Sequence[float],
                   clear: bool = True) -> None:
     """
-    Applies an Euler rotation on the object with ZYX order.
+    Applies an Euler rotation on the object with ZYX order, setting its world matrix in a single step.
     :param obj: the object
     :param rotation: the rotation vector
     :param clear: tells whether the rotation should be based on the initial orientation of the object or not
     :return: nothing
     """
 
-    try:
-        bpy.ops.object.mode_set(mode="OBJECT")
-    except:
-        pass
-
-    if clear:
-        obj.rotation_euler = [0, 0, 0]
+    if bpy.context.mode != "OBJECT":
+        try:
+            bpy.ops.object.mode_set(mode="OBJECT")
+        except:
+            pass
 
-    rot_z = Matrix.Rotation(math.radians(rotation[2]), 3, "Z")
-    rot_y = Matrix.Rotation(math.radians(rotation[1]), 3, "Y")
-    rot_x = Matrix.Rotation(math.radians(rotation[0]), 3, "X")
-    obj.rotation_euler = (rot_z @ obj.rotation_euler.to_matrix()).to_euler()
-    obj.rotation_euler = (rot_y @ obj.rotation_euler.to_matrix()).to_euler()
-    obj.rotation_euler = (rot_x @ obj.rotation_euler.to_matrix()).to_euler()
+    matrix = rotation_matrix(rotation)
+    if not clear:
+        matrix = matrix @ obj.rotation_euler.to_matrix()
+    obj.matrix_world = Matrix.LocRotScale(obj.location, matrix, obj.scale)
+    state.request_update()
 
 
 def same_faces(face1: bmesh.types.BMFace,
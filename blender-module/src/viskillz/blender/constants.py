@@ -6,7 +6,8 @@ COLLECTION_PERMUTATIONS = "Permutations"
 COLLECTION_SHAPES = "Shapes"
 COLLECTION_TMP = "Tmp"
 
-HEADING_PERMUTE_SHAPE = "\t".join([f"{'time':<9}", f"{'shape':<16}", f"{'cor':>3}", f"{'emp':>3}"])
+HEADING_PERMUTE_SHAPE = "\t".join([f"{'time':<9}", f"{'shape':<16}", f"{'cor':>3}", f"{'emp':>3}", f"{'hit':>4}",
+                                   f"{'shr':>3}", f"{'mis':>3}"])
 
 
 def rotation_vectors(generate_all: bool = False) -> List[List[int]]:
@@ -26,6 +27,42 @@ def rotation_vectors(generate_all: bool = False) -> List[List[int]]:
         else [rotation for rotation in rotations if rotation[0] == 0 or (rotation[0] == 90 and rotation[1] in [0, 180])]
 
 
+def scale_vectors(factor: float = 0.7) -> List[List[float]]:
+    """
+    Returns the vectors of the scaled permutations of a shape.
+    :param factor: the scaling factor
+    :return: the list of vectors
+    """
+    o = 1
+    s = factor
+    return [
+        [o, o, o], [s, o, o], [o, s, o], [o, o, s],
+        [s, s, o], [s, o, s], [o, s, s]
+    ]
+
+
+def get_scaled_name(name: str,
+                    vector: List[float]) -> str:
+    """
+    Returns the name of a scaled permutation of a shape.
+    :param name: the name of the shape
+    :param vector: the scaling vector
+    :return: the name of the permutation
+    """
+    return name + "." + "".join("0" if c == 1 else "1" for c in vector)
+
+
+def get_case_id(frame_name: str,
+                rotation: List[float]) -> str:
+    return frame_name[1:] + "." + str(rotation[0] // 90) + str(rotation[1] // 90) + str(rotation[2] // 90)
+
+
+def scenario_file_name(shape_id: str,
+                       rotation: List[int],
+                       frame: int) -> str:
+    return ".".join([shape_id, "".join([str(r // 90) for r in rotation]), str(frame).zfill(2)])
+
+
 def plane_vectors(scale: float = 2.0) -> List[List[Tuple[float, float, float]]]:
     """
     Returns the vectors that describe the intersection planes.
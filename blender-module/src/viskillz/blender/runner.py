@@ -1,17 +1,21 @@
 import sys
 
 import viskillz.blender.stages.export_answers as permute
-from viskillz.blender.stages import export_svg, export_glb
+from viskillz.blender.stages import export_svg, export_glb, export_snapshot
+from viskillz.common.cli import option
 
 
 def run() -> None:
     args = sys.argv[sys.argv.index("--") + 1:]
     if args[0] == "-ans":
-        permute.export_group(path=args[1], group_id=args[2])
+        permute.export_group(path=args[1], group_id=args[2], verify="-verify" in args)
     elif args[0] == "-3d":
-        export_glb.export_group(path_out=args[1], group_id=args[2])
+        export_glb.export_group(path_out=args[1], group_id=args[2], packed="-pack" in args,
+                                profile=option(args, "-profile", export_glb.PROFILE_DEFAULT))
     elif args[0] == "-2d":
-        export_svg.export_group(path_out=args[1], group_id=args[2], camera=int(args[3]))
+        export_svg.export_group(path_out=args[1], group_id=args[2], camera=int(args[3]), packed="-pack" in args)
+    elif args[0] == "-snap":
+        export_snapshot.export_snapshot(path_out=args[1])
 
 
 if __name__ == "__main__":
@@ -1,7 +1,84 @@
+from typing import Dict, Iterable, Set
+
 import bpy
 from viskillz.blender.constants import COLLECTION_TMP
 
 
+class SceneState:
+    """
+    Tracks the visibility of the objects, the hidden collections and the pending updates of the view layer, thus only
+    the differences are applied on the scene. Objects should be forgotten when they are deleted or created with a
+    reused name.
+    """
+
+    def __init__(self) -> None:
+        self.visibility: Dict[str, bool] = dict()
+        self.hidden_collections: Dict[str, Set[str]] = dict()
+        self.pending_update = False
+
+    def toggle_object(self,
+                      name: str,
+                      value: bool) -> None:
+        """
+        Toggles the visibility and the selection of an object, setting only the properties that differ.
+        :param name: the name of the object
+        :param value: determines whether the object should be seen or not
+        :return: nothing
+        """
+        ob = bpy.data.objects[name]
+        if self.visibility.get(name) == value and ob.select_get() == value:
+            return
+
+        hidden = not value
+        if ob.hide_get() != hidden:
+            ob.hide_set(hidden)
+        if ob.hide_render != hidden:
+            ob.hide_render = hidden
+        if ob.hide_viewport != hidden:
+            ob.hide_viewport = hidden
+        if ob.select_get() != value:
+            ob.select_set(value)
+        self.visibility[name] = value
+        if value:
+            self.reveal(collection.name for collection in ob.users_collection)
+
+    def reveal(self, names: Iterable[str]) -> None:
+        """
+        Forgets the hidden collections that contain any of the given collections, as they may have visible objects.
+        :param names: the names of the collections
+        :return: nothing
+        """
+        names = set(names)
+        self.hidden_collections = {name: tree for name, tree in self.hidden_collections.items() if not tree & names}
+
+    def forget(self, name: str) -> None:
+        """
+        Forgets the tracked state of an object.
+        :param name: the name of the object
+        :return: nothing
+        """
+        self.visibility.pop(name, None)
+
+    def request_update(self) -> None:
+        """
+        Marks the view layer to be updated before it is used next time.
+        :return: nothing
+        """
+        self.pending_update = True
+
+    def update(self) -> None:
+        """
+        Updates the view layer if there is a pending request.
+        :return: nothing
+        """
+        if self.pending_update:
+            bpy.context.view_layer.update()
+            self.pending_update = False
+
+
+state = SceneState()
+
+
 def toggle_collection(name: str,
                       value: bool) -> None:
     """
@@ -17,6 +94,18 @@ def toggle_collection(name: str,
         toggle_collection(child.name, value)
 
 
+def collection_tree(name: str) -> Set[str]:
+    """
+    Collects the names of a collection and its descendants.
+    :param name: the name of the collection
+    :return: the names
+    """
+    names = {name}
+    for child in bpy.data.collections[name].children:
+        names |= collection_tree(child.name)
+    return names
+
+
 def toggle_object(name: str,
                   value: bool) -> None:
     """
@@ -26,11 +115,7 @@ def toggle_object(name: str,
     :return: nothing
     """
     try:
-        ob = bpy.data.objects[name]
-        ob.hide_set(not value)
-        ob.hide_render = not value
-        ob.hide_viewport = not value
-        ob.select_set(value)
+        state.toggle_object(name, value)
     except RuntimeError:
         pass
 
@@ -48,11 +133,15 @@ def delete_collection(name: str) -> None:
 
 def hide_collection(name: str) -> None:
     """
-    Hides the collection by its name.
+    Hides the collection by its name. The collection is not walked again until one of its objects is shown, or a new
+    object is linked to it.
     :param name: the name
     :return: nothing
     """
+    if name in state.hidden_collections:
+        return
     toggle_collection(name, False)
+    state.hidden_collections[name] = collection_tree(name)
 
 
 def hide_object(name: str) -> None:
@@ -84,6 +173,7 @@ def delete_object(name: str) -> None:
     """
     obj = bpy.data.objects[name]
     bpy.data.objects.remove(obj, do_unlink=True)
+    state.forget(name)
 
 
 def duplicate_object(name: str,
@@ -92,6 +182,7 @@ def duplicate_object(name: str,
     """
     Duplicates an object. It is possible to assign the given name to the new object, then link it to the given collection.
     Without specifying these values, the object will get its default name, and assigned to the TMP collection.
+    The update of the view layer is deferred until the next call of state.update().
 
     :param name: the name of the object
     :param copy_collection: the name of the collection to which the new object should be linked
@@ -102,9 +193,12 @@ def duplicate_object(name: str,
     original_intersection = bpy.data.objects[name]
     intersection = original_intersection.copy()
     intersection.data = original_intersection.data.copy()
-    bpy.data.collections[COLLECTION_TMP if copy_collection is None else copy_collection].objects.link(intersection)
+    collection = COLLECTION_TMP if copy_collection is None else copy_collection
+    bpy.data.collections[collection].objects.link(intersection)
     if copy_name is not None:
         intersection.name = copy_name
     bpy.context.collection.objects.link(intersection)
-    bpy.context.view_layer.update()
+    state.forget(intersection.name)
+    state.reveal([collection])
+    state.request_update()
     return intersection.name
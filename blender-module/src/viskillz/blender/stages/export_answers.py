@@ -1,16 +1,20 @@
 import json
 import os
 from datetime import datetime
+from typing import Callable
 
 import bpy
-from viskillz.blender.common import contour_edges, scale_object, create_answer, get_case_id
+from viskillz.blender.common import contour_edges, scale_object, create_answer, empty_sections, create_base, \
+    create_section, half_turn_pairs
 from viskillz.blender.constants import *
 from viskillz.blender.scene import delete_collection, hide_collection, delete_object
+from viskillz.common.answers import EMPTY, negate_edges, same_answers
 from viskillz.common.file import init_dir
 
 
 def export_group(path: str,
-                 group_id: str) -> None:
+                 group_id: str,
+                 verify: bool = False) -> None:
     shape_ids = []
     for collection in bpy.data.collections[COLLECTION_SHAPES].children:
         if collection.name.startswith(group_id):
@@ -19,18 +23,50 @@ def export_group(path: str,
 
     shape_ids.sort()
     for shape_id in shape_ids:
-        export_shape(path, shape_id)
+        export_shape(path, shape_id, verify)
+
+
+def intersection_edges(create: Callable[[], bpy.types.Object]):
+    """
+    Calculates the contour of an intersection, then deletes the intersection and the temporary objects.
+    :param create: the function creating the intersection, i.e., create_section or create_answer with its arguments
+    :return: the list of edges, or "empty"
+    """
+    try:
+        intersection = create()
+    except ValueError:
+        delete_collection(COLLECTION_TMP)
+        return EMPTY
+
+    edges = contour_edges(intersection)
+    delete_object(intersection.name)
+    delete_collection(COLLECTION_TMP)
+    return edges
 
 
 def export_shape(path_root: str,
-                 original_name: str) -> None:
+                 original_name: str,
+                 verify: bool = False) -> None:
+    """
+    Exports the intersections of the scaled permutations of a shape.
+    Each rotated permutation is created once and bisected by all the planes. The intersections of rotations that
+    differ by a half turn around the normal vector of a plane are derived from each other. If verification is
+    requested, each intersection is also calculated separately by create_answer, and the latter is exported in the
+    case of a mismatch.
+    :param path_root: the output directory
+    :param original_name: the name of the shape
+    :param verify: tells whether the intersections should be compared with the ones of create_answer or not
+    :return: nothing
+    """
     delete_collection(COLLECTION_TMP)
     [hide_collection(collection_name) for collection_name in
      [COLLECTION_SHAPES, COLLECTION_FRAMES_2D, COLLECTION_FRAMES_3D, COLLECTION_TMP]]
 
     planes = plane_vectors(scale=20)
     rotations = rotation_vectors()
+    indices = [1, 2, 10, 16, 20]
 
+    pairs = {index: half_turn_pairs(rotations, planes[index - 1]) for index in indices}
     scaleds = scale_object(bpy.data.objects[original_name])
 
     print(HEADING_PERMUTE_SHAPE)
@@ -38,31 +74,56 @@ def export_shape(path_root: str,
         log_buffer = [datetime.now().strftime("%H:%M:%S"), shape_name]
         empty_count = 0
         correct_count = 0
+        rejected_count = 0
+        shared_count = 0
+        mismatch_count = 0
 
         init_dir(path_root, False)
         json_buffer = dict()
-        for rotation in rotations:
-            for index in [1, 2, 10, 16, 20]:
+        empty = empty_sections(bpy.data.objects[shape_name], rotations, [planes[index - 1] for index in indices],
+                               ratio_value=20.0)
+        for i, rotation in enumerate(rotations):
+            base_name = None
+            for j, index in enumerate(indices):
                 frame_name = "F{:02d}".format(index)
                 case_id = get_case_id(frame_name, rotation)
-                try:
-                    intersection = create_answer(shape_name, planes[index - 1][0], planes[index - 1][1],
-                                                 rotation, diff=planes[index - 1][2], ratio_value=20.0)
-                    correct_count += 1
-                except ValueError:
+                plane = planes[index - 1]
+                if empty[i, j]:
                     empty_count += 1
-                    delete_collection(COLLECTION_TMP)
-                    json_buffer[case_id] = "empty"
+                    rejected_count += 1
+                    json_buffer[case_id] = EMPTY
                     continue
 
-                edges = contour_edges(intersection)
+                if i in pairs[index]:
+                    edges = negate_edges(json_buffer[get_case_id(frame_name, rotations[pairs[index][i]])])
+                    shared_count += 1
+                else:
+                    if base_name is None:
+                        base_name = create_base(shape_name, rotation).name
+                    edges = intersection_edges(lambda: create_section(base_name, plane[0], plane[1], diff=plane[2],
+                                                                      ratio_value=20.0))
+
+                if verify:
+                    reference = intersection_edges(lambda: create_answer(shape_name, plane[0], plane[1], rotation,
+                                                                         diff=plane[2], ratio_value=20.0))
+                    if not same_answers(edges, reference):
+                        mismatch_count += 1
+                        print(f"Mismatch: {shape_name} {case_id}")
+                        edges = reference
+
+                if edges == EMPTY:
+                    empty_count += 1
+                else:
+                    correct_count += 1
                 json_buffer[case_id] = edges
-                delete_object(intersection.name)
-                delete_collection(COLLECTION_TMP)
+            if base_name is not None:
+                delete_object(base_name)
         delete_object(shape_name)
         with open(os.path.join(path_root, f"{shape_name}.json"), "w") as file:
             json.dump(json_buffer, file)
-            log_buffer += [str(correct_count), str(empty_count)]
+            log_buffer += [str(correct_count), str(empty_count),
+                           f"{rejected_count / empty_count:.0%}" if empty_count > 0 else "-",
+                           str(shared_count), str(mismatch_count) if verify else "-"]
             print("\t".join(log_buffer))
 
     delete_collection(COLLECTION_PERMUTATIONS)
@@ -1,26 +1,42 @@
 import os
+from typing import Optional
 
 import bpy
 from viskillz.blender.common import move, rotate_global, scale_object
-from viskillz.blender.constants import rotation_vectors, COLLECTION_PERMUTATIONS
+from viskillz.blender.constants import rotation_vectors, scenario_file_name, COLLECTION_PERMUTATIONS
 from viskillz.blender.scene import delete_collection, show_object, hide_object
 from viskillz.blender.stages.common import clean_and_get_shape_ids
+from viskillz.common.archive import ArchiveWriter, archive_path
+from viskillz.common.glb import PROFILE_COMPACT, PROFILE_DEFAULT, compact_glb
+
+EXPORT_OPTIONS = {
+    PROFILE_DEFAULT: dict(),
+    PROFILE_COMPACT: dict(
+        export_normals=False, export_tangents=False, export_texcoords=False, export_colors=False,
+        export_materials="NONE", export_animations=False, export_cameras=False, export_lights=False,
+        export_extras=False
+    )
+}
 
 
 def export_group(path_out: str,
-                 group_id: str) -> None:
+                 group_id: str,
+                 packed: bool = False,
+                 profile: str = PROFILE_DEFAULT) -> None:
+    archive = ArchiveWriter(archive_path(path_out, group_id)) if packed else None
     for original_id in clean_and_get_shape_ids(group_id):
         scaled_shape_ids = scale_object(bpy.data.objects[original_id])
         for shape_id in scaled_shape_ids:
-            export_shape(path_out, shape_id)
+            export_shape(path_out, shape_id, archive, profile)
         delete_collection(COLLECTION_PERMUTATIONS)
+    if archive is not None:
+        archive.close()
 
 
 def export_shape(path_out: str,
-                 shape_id: str) -> None:
-    def inner_file_name(shape_id: str, rotation, frame: int):
-        return ".".join([shape_id, "".join([str(r // 90) for r in rotation]), str(frame).zfill(2)])
-
+                 shape_id: str,
+                 archive: Optional[ArchiveWriter] = None,
+                 profile: str = PROFILE_DEFAULT) -> None:
     shape = bpy.data.objects[shape_id]
     old_location = move(shape_id, [0, 0, 0])
     show_object(shape_id)
@@ -32,8 +48,24 @@ def export_shape(path_out: str,
         show_object(frame_id)
         for rotation in rotations:
             rotate_global(shape, rotation)
-            out_file = os.path.join(path_out, inner_file_name(shape_id, rotation, frame))
-            bpy.ops.export_scene.gltf(filepath=out_file, use_selection=True)
+            out_file = os.path.join(path_out, scenario_file_name(shape_id, rotation, frame))
+            bpy.ops.export_scene.gltf(filepath=out_file, use_selection=True, **EXPORT_OPTIONS[profile])
+            if profile == PROFILE_COMPACT:
+                compact_file(out_file + ".glb")
+            if archive is not None:
+                archive.add_file(os.path.basename(out_file) + ".glb", out_file + ".glb")
         hide_object(frame_id)
     hide_object(shape_id)  # explicit rotate 0, 0, 0
     move(shape_id, old_location)
+
+
+def compact_file(path: str) -> None:
+    """
+    Replaces an exported GLB document with its compact version.
+    :param path: the path of the document
+    :return: nothing
+    """
+    with open(path, "rb") as file:
+        data = compact_glb(file.read())
+    with open(path, "wb") as file:
+        file.write(data)
@@ -0,0 +1,82 @@
+import re
+
+import bpy
+import numpy as np
+from viskillz.blender.constants import COLLECTION_SHAPES
+from viskillz.offline.snapshot import KIND_FRAME, KIND_SHAPE, Mesh, Snapshot, save_snapshot
+
+PATTERN_FRAME = re.compile(r"[FRC]\d\d")
+PATTERN_CAMERA = re.compile(r"Camera\.Scenario\.O\d+")
+
+
+def extract_mesh(obj: bpy.types.Object,
+                 kind: str,
+                 group: str = "") -> Mesh:
+    """
+    Extracts the mesh and the world matrix of an object.
+    :param obj: the object
+    :param kind: the kind of the object
+    :param group: the name of the collection of the group containing the object
+    :return: the extracted mesh
+    """
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+
+    vertices = np.empty(len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get("co", vertices)
+    polygons = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", polygons)
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+
+    return Mesh(
+        name=obj.name, kind=kind, group=group, mesh_name=mesh.name,
+        vertices=vertices.reshape((-1, 3)), polygons=polygons,
+        polygon_offsets=np.append(loop_starts, len(polygons)).astype(np.int32),
+        triangles=triangles.reshape((-1, 3)), matrix=np.array(obj.matrix_world)
+    )
+
+
+def extract_camera(obj: bpy.types.Object) -> dict:
+    """
+    Extracts the properties of a camera that determine its projection.
+    :param obj: the camera
+    :return: the properties
+    """
+    render = bpy.context.scene.render
+    return {
+        "matrix": [list(row) for row in obj.matrix_world],
+        "type": obj.data.type,
+        "lens": obj.data.lens,
+        "ortho_scale": obj.data.ortho_scale,
+        "sensor_fit": obj.data.sensor_fit,
+        "sensor_width": obj.data.sensor_width,
+        "sensor_height": obj.data.sensor_height,
+        "shift": [obj.data.shift_x, obj.data.shift_y],
+        "clip": [obj.data.clip_start, obj.data.clip_end],
+        "resolution": [render.resolution_x, render.resolution_y, render.resolution_percentage]
+    }
+
+
+def export_snapshot(path_out: str) -> None:
+    """
+    Writes the shapes, the F##/R##/C## frames and the scenario cameras of the project into a snapshot.
+    :param path_out: the path of the snapshot
+    :return: nothing
+    """
+    snapshot = Snapshot()
+    for collection in bpy.data.collections[COLLECTION_SHAPES].children:
+        for obj in collection.objects:
+            if obj.type == "MESH":
+                snapshot.meshes[obj.name] = extract_mesh(obj, KIND_SHAPE, collection.name)
+
+    for obj in bpy.data.objects:
+        if obj.type == "MESH" and PATTERN_FRAME.fullmatch(obj.name):
+            snapshot.meshes[obj.name] = extract_mesh(obj, KIND_FRAME)
+        elif obj.type == "CAMERA" and PATTERN_CAMERA.fullmatch(obj.name):
+            snapshot.cameras[obj.name] = extract_camera(obj)
+
+    save_snapshot(path_out, snapshot)
+    print(f"{len(snapshot.meshes)} meshes and {len(snapshot.cameras)} cameras written to {path_out}")
@@ -1,10 +1,12 @@
 import os
+from typing import Optional
 
 import bpy
 from viskillz.blender.common import move, rotate_global
 from viskillz.blender.constants import rotation_vectors
 from viskillz.blender.scene import show_object, hide_object
 from viskillz.blender.stages.common import clean_and_get_shape_ids
+from viskillz.common.archive import ArchiveWriter, archive_path
 
 
 def file_name(shape_id: str,
@@ -16,15 +18,20 @@ def file_name(shape_id: str,
 
 def export_group(path_out: str,
                  group_id: str,
-                 camera: int = 1) -> None:
+                 camera: int = 1,
+                 packed: bool = False) -> None:
     bpy.context.scene.camera = bpy.data.objects[f"Camera.Scenario.O{camera}"]
+    archive = ArchiveWriter(archive_path(path_out, group_id)) if packed else None
     for shape_id in clean_and_get_shape_ids(group_id):
-        export_shape(path_out, shape_id, camera)
+        export_shape(path_out, shape_id, camera, archive)
+    if archive is not None:
+        archive.close()
 
 
 def export_shape(path_out: str,
                  shape_id: str,
-                 camera: int = 1) -> None:
+                 camera: int = 1,
+                 archive: Optional[ArchiveWriter] = None) -> None:
     shape = bpy.data.objects[shape_id]
     old_location = move(shape_id, [0, 0, 0])
     show_object(shape_id)
@@ -40,6 +47,9 @@ def export_shape(path_out: str,
             ) + "."
             bpy.context.scene.render.use_file_extension = False
             bpy.ops.render.render(layer="FreeStyle", write_still=False)
+            if archive is not None:
+                svg_file = bpy.context.scene.render.filepath + f"{bpy.context.scene.frame_current:04d}.svg"
+                archive.add_file(os.path.basename(svg_file), svg_file)
         hide_object(frame_id)
     hide_object(shape_id)  # explicit rotate 0, 0, 0
     move(shape_id, old_location)
@@ -0,0 +1,43 @@
+from typing import List, Tuple, Union
+
+import numpy as np
+
+EMPTY = "empty"
+
+Edges = List[Tuple[Tuple[float, float], Tuple[float, float]]]
+
+
+def negate_edges(edges: Union[Edges, str]) -> Union[Edges, str]:
+    """
+    Rotates the contour of an intersection by a half turn around the center of the camera.
+    :param edges: the list of edges, or "empty"
+    :return: the rotated list of edges, or "empty"
+    """
+    if edges == EMPTY:
+        return EMPTY
+    return [((-a[0], -a[1]), (-b[0], -b[1])) for a, b in edges]
+
+
+def same_answers(first: Union[Edges, str],
+                 second: Union[Edges, str],
+                 tolerance: float = 0.001) -> bool:
+    """
+    Determines whether two answers describe the same contour, regardless of the order and the direction of the edges.
+    Each edge must have a counterpart in the other answer whose endpoints are closer than the tolerance.
+    :param first: the first list of edges, or "empty"
+    :param second: the second list of edges, or "empty"
+    :param tolerance: the maximal distance of the matching endpoints
+    :return: the result
+    """
+    if first == EMPTY or second == EMPTY:
+        return first == second
+    if len(first) != len(second):
+        return False
+    if len(first) == 0:
+        return True
+
+    a, b = np.array(first, dtype=float), np.array(second, dtype=float)
+    straight = np.abs(a[:, None, 0] - b[None, :, 0]).max(axis=2) + np.abs(a[:, None, 1] - b[None, :, 1]).max(axis=2)
+    swapped = np.abs(a[:, None, 0] - b[None, :, 1]).max(axis=2) + np.abs(a[:, None, 1] - b[None, :, 0]).max(axis=2)
+    distances = np.minimum(straight, swapped)
+    return bool(np.all(distances.min(axis=1) < tolerance) and np.all(distances.min(axis=0) < tolerance))
@@ -0,0 +1,153 @@
+import os
+from typing import Dict, Iterator, Tuple
+
+EXTENSION_DATA = ".pack"
+EXTENSION_INDEX = ".idx"
+
+
+class ArchiveWriter:
+    """
+    Appends files to a packed archive. The archive consists of a data file, which contains the concatenated payloads,
+    and a separate index file, which contains a tab-separated line (name, offset, size) for each payload.
+    An index line is written only after its payload has been flushed, so a partially written payload of an interrupted
+    run is never referenced and it is truncated when the archive is opened again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens the archive with the given path (without extension) for appending.
+        :param path: the path of the archive
+        """
+        self.path = path
+        self.end = 0
+        if os.path.exists(path + EXTENSION_INDEX):
+            with open(path + EXTENSION_INDEX, "rb+") as file:
+                file.truncate(file.read().rfind(b"\n") + 1)
+            for _, offset, size in read_index(path + EXTENSION_INDEX):
+                self.end = max(self.end, offset + size)
+        self.data = open(path + EXTENSION_DATA, "ab")
+        self.data.truncate(self.end)
+        self.data.seek(self.end)
+        self.index = open(path + EXTENSION_INDEX, "a", encoding="utf-8")
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def add(self,
+            name: str,
+            data: bytes) -> None:
+        """
+        Appends a payload to the archive.
+        :param name: the name of the entry
+        :param data: the payload
+        :return: nothing
+        """
+        self.data.write(data)
+        self.data.flush()
+        self.index.write(f"{name}\t{self.end}\t{len(data)}\n")
+        self.index.flush()
+        self.end += len(data)
+
+    def add_file(self,
+                 name: str,
+                 path: str,
+                 remove: bool = True) -> None:
+        """
+        Appends the content of a file to the archive.
+        :param name: the name of the entry
+        :param path: the path of the file
+        :param remove: whether the file should be deleted after being archived or not
+        :return: nothing
+        """
+        with open(path, "rb") as file:
+            self.add(name, file.read())
+        if remove:
+            os.remove(path)
+
+    def close(self) -> None:
+        """
+        Closes the data and the index files of the archive.
+        :return: nothing
+        """
+        self.data.close()
+        self.index.close()
+
+
+class ArchiveReader:
+    """
+    Provides random access to the entries of a packed archive by their names.
+    Only the index file is read while opening the archive. If an entry has been appended more than once, the last
+    occurrence is used.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Opens the archive with the given path (without extension) for reading.
+        :param path: the path of the archive
+        """
+        self.path = path
+        self.entries: Dict[str, Tuple[int, int]] = dict()
+        for name, offset, size in read_index(path + EXTENSION_INDEX):
+            self.entries[name] = (offset, size)
+        self.data = open(path + EXTENSION_DATA, "rb")
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def read(self, name: str) -> bytes:
+        """
+        Reads an entry of the archive.
+        :param name: the name of the entry
+        :return: the payload
+        """
+        offset, size = self.entries[name]
+        self.data.seek(offset)
+        return self.data.read(size)
+
+    def close(self) -> None:
+        """
+        Closes the data file of the archive.
+        :return: nothing
+        """
+        self.data.close()
+
+
+def read_index(path: str) -> Iterator[Tuple[str, int, int]]:
+    """
+    Reads the entries of an index file. Incomplete lines are skipped.
+    :param path: the path of the index file
+    :return: the (name, offset, size) triplets
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                continue
+            fields = line[:-1].split("\t")
+            if len(fields) == 3:
+                yield fields[0], int(fields[1]), int(fields[2])
+
+
+def archive_path(path_out: str,
+                 group_id: str) -> str:
+    """
+    Returns the path (without extension) of the archive of a group.
+    :param path_out: the output directory of the group
+    :param group_id: the ID of the group
+    :return: the path
+    """
+    return os.path.join(path_out, group_id)
@@ -0,0 +1,11 @@
+def option(args: list[str],
+           name: str,
+           default: str) -> str:
+    """
+    Returns the value following an optional argument.
+    :param args: the arguments
+    :param name: the name of the optional argument
+    :param default: the value returned if the argument is missing
+    :return: the value
+    """
+    return args[args.index(name) + 1] if name in args else default
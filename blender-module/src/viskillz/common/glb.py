@@ -0,0 +1,246 @@
+import json
+import struct
+from typing import Dict, List, Tuple
+
+GLB_MAGIC = 0x46546C67
+GLB_VERSION = 2
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+TARGET_ARRAY_BUFFER = 34962
+TARGET_ELEMENT_ARRAY_BUFFER = 34963
+
+COMPONENT_FORMATS = {5120: "b", 5121: "B", 5122: "h", 5123: "H", 5125: "I", 5126: "f"}
+TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+
+EXTENSION_QUANTIZATION = "KHR_mesh_quantization"
+
+PROFILE_COMPACT = "compact"
+PROFILE_DEFAULT = "default"
+
+
+def read_glb(data: bytes) -> Tuple[dict, bytes]:
+    """
+    Splits a GLB document into its JSON and binary chunks.
+    :param data: the content of the GLB document
+    :return: the parsed JSON chunk and the binary chunk
+    """
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    if magic != GLB_MAGIC or version != GLB_VERSION:
+        raise ValueError("Not a GLB 2.0 document.")
+
+    gltf, binary = None, b""
+    offset = 12
+    while offset < length:
+        chunk_length, chunk_type = struct.unpack_from("<II", data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == CHUNK_JSON:
+            gltf = json.loads(chunk.decode("utf-8"))
+        elif chunk_type == CHUNK_BIN:
+            binary = chunk
+        offset += 8 + chunk_length
+
+    if gltf is None:
+        raise ValueError("The GLB document has no JSON chunk.")
+    return gltf, binary
+
+
+def write_glb(gltf: dict,
+              binary: bytes) -> bytes:
+    """
+    Assembles a GLB document. The JSON chunk is serialized deterministically.
+    :param gltf: the JSON chunk
+    :param binary: the binary chunk
+    :return: the content of the GLB document
+    """
+    json_chunk = json.dumps(gltf, separators=(",", ":")).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    binary += b"\x00" * (-len(binary) % 4)
+
+    chunks = struct.pack("<II", len(json_chunk), CHUNK_JSON) + json_chunk
+    if len(binary) > 0:
+        chunks += struct.pack("<II", len(binary), CHUNK_BIN) + binary
+    return struct.pack("<III", GLB_MAGIC, GLB_VERSION, 12 + len(chunks)) + chunks
+
+
+def read_accessor(gltf: dict,
+                  binary: bytes,
+                  index: int) -> List[Tuple]:
+    """
+    Reads the elements of an accessor that refers to the binary chunk.
+    :param gltf: the JSON chunk
+    :param binary: the binary chunk
+    :param index: the index of the accessor
+    :return: the list of elements, each of them represented by a tuple of its components
+    """
+    accessor = gltf["accessors"][index]
+    if "bufferView" not in accessor or "sparse" in accessor:
+        raise ValueError(f"Accessor {index} is not supported.")
+
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    component = struct.Struct("<" + COMPONENT_FORMATS[accessor["componentType"]] * TYPE_SIZES[accessor["type"]])
+    stride = view.get("byteStride", component.size)
+    offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+    return [component.unpack_from(binary, offset + i * stride) for i in range(accessor["count"])]
+
+
+class BufferBuilder:
+    """
+    Collects buffer views and accessors of a glTF document into a single binary buffer.
+    Byte-wise identical buffer views are stored only once.
+    """
+
+    def __init__(self) -> None:
+        self.binary = bytearray()
+        self.views: List[dict] = []
+        self.accessors: List[dict] = []
+        self.view_ids: Dict[Tuple[bytes, int, int], int] = dict()
+
+    def add_view(self,
+                 data: bytes,
+                 target: int,
+                 stride: int = 0) -> int:
+        """
+        Adds a buffer view, aligned to 4 bytes.
+        :param data: the content of the view
+        :param target: the target of the view
+        :param stride: the stride of the elements, 0 if the elements are tightly packed
+        :return: the index of the view
+        """
+        key = (data, target, stride)
+        if key not in self.view_ids:
+            self.binary += b"\x00" * (-len(self.binary) % 4)
+            view = {"buffer": 0, "byteOffset": len(self.binary), "byteLength": len(data), "target": target}
+            if stride > 0:
+                view["byteStride"] = stride
+            self.binary += data
+            self.view_ids[key] = len(self.views)
+            self.views.append(view)
+        return self.view_ids[key]
+
+    def add_accessor(self,
+                     elements: List[Tuple],
+                     component_type: int,
+                     accessor_type: str,
+                     target: int,
+                     bounds: bool = False) -> int:
+        """
+        Adds an accessor and its buffer view. The elements of vertex attributes are padded to 4 bytes.
+        :param elements: the elements, each of them represented by a tuple of its components
+        :param component_type: the component type of the accessor
+        :param accessor_type: the type of the accessor
+        :param target: the target of the buffer view
+        :param bounds: whether the minimal and maximal components should be stored or not
+        :return: the index of the accessor
+        """
+        component = struct.Struct("<" + COMPONENT_FORMATS[component_type] * TYPE_SIZES[accessor_type])
+        stride = 0
+        padding = b""
+        if target == TARGET_ARRAY_BUFFER and component.size % 4 != 0:
+            stride = component.size + (-component.size % 4)
+            padding = b"\x00" * (stride - component.size)
+
+        data = b"".join(component.pack(*element) + padding for element in elements)
+        accessor = {
+            "bufferView": self.add_view(data, target, stride),
+            "componentType": component_type,
+            "count": len(elements),
+            "type": accessor_type
+        }
+        if bounds and len(elements) > 0:
+            accessor["min"] = [min(element[i] for element in elements) for i in range(len(elements[0]))]
+            accessor["max"] = [max(element[i] for element in elements) for i in range(len(elements[0]))]
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def add_indices(self, indices: List[int]) -> int:
+        """
+        Adds an index accessor using the smallest sufficient component type.
+        :param indices: the indices
+        :return: the index of the accessor
+        """
+        largest = max(indices, default=0)
+        component_type = 5121 if largest < 2 ** 8 else 5123 if largest < 2 ** 16 else 5125
+        return self.add_accessor([(i,) for i in indices], component_type, "SCALAR", TARGET_ELEMENT_ARRAY_BUFFER)
+
+    def finish(self, gltf: dict) -> bytes:
+        """
+        Assigns the collected buffer views and accessors to the document and returns the binary chunk.
+        :param gltf: the JSON chunk
+        :return: the binary chunk
+        """
+        gltf["accessors"] = self.accessors
+        gltf["bufferViews"] = self.views
+        gltf["buffers"] = [{"byteLength": len(self.binary) + (-len(self.binary) % 4)}]
+        return bytes(self.binary)
+
+
+def compact_glb(data: bytes,
+                bits: int = 16) -> bytes:
+    """
+    Creates a compact version of a GLB document, keeping only the positions and the indices of the meshes.
+    The vertices of each mesh are deduplicated after quantizing them to unsigned integers (KHR_mesh_quantization),
+    and all the primitives of a mesh share the same position accessor. The dequantization transform is stored in a new
+    child node of each node referring to the mesh. Materials, animations and other attributes are dropped.
+    :param data: the content of the GLB document
+    :param bits: the number of bits used to quantize the coordinates (at most 16)
+    :return: the content of the compact GLB document
+    """
+    gltf, binary = read_glb(data)
+    levels = 2 ** bits - 1
+    component_type = 5121 if bits <= 8 else 5123
+
+    builder = BufferBuilder()
+    meshes, transforms = [], []
+    for mesh in gltf.get("meshes", []):
+        sources = []
+        for primitive in mesh["primitives"]:
+            positions = read_accessor(gltf, binary, primitive["attributes"]["POSITION"])
+            indices = [i[0] for i in read_accessor(gltf, binary, primitive["indices"])] \
+                if "indices" in primitive \
+                else list(range(len(positions)))
+            sources.append((positions, indices))
+
+        lower = [min((p[i] for positions, _ in sources for p in positions), default=0.0) for i in range(3)]
+        upper = [max((p[i] for positions, _ in sources for p in positions), default=0.0) for i in range(3)]
+        scale = [(upper[i] - lower[i]) / levels if upper[i] > lower[i] else 1.0 for i in range(3)]
+
+        vertices: Dict[Tuple[int, int, int], int] = dict()
+        primitives_indices = []
+        for positions, indices in sources:
+            primitive_indices = []
+            for i in indices:
+                vertex = tuple(round((positions[i][j] - lower[j]) / scale[j]) for j in range(3))
+                primitive_indices.append(vertices.setdefault(vertex, len(vertices)))
+            primitives_indices.append(primitive_indices)
+
+        position = builder.add_accessor(list(vertices), component_type, "VEC3", TARGET_ARRAY_BUFFER, bounds=True)
+        primitives = []
+        for primitive, primitive_indices in zip(mesh["primitives"], primitives_indices):
+            compact = {"attributes": {"POSITION": position}, "indices": builder.add_indices(primitive_indices)}
+            if "mode" in primitive:
+                compact["mode"] = primitive["mode"]
+            primitives.append(compact)
+
+        compact_mesh = {"primitives": primitives}
+        if "name" in mesh:
+            compact_mesh["name"] = mesh["name"]
+        meshes.append(compact_mesh)
+        transforms.append((lower, scale))
+
+    nodes = [dict(node) for node in gltf.get("nodes", [])]
+    for node in list(nodes):
+        if "mesh" in node:
+            lower, scale = transforms[node["mesh"]]
+            nodes.append({"mesh": node.pop("mesh"), "translation": lower, "scale": scale})
+            node["children"] = node.get("children", []) + [len(nodes) - 1]
+
+    compact = {"asset": gltf["asset"]}
+    for key in ["scene", "scenes", "cameras"]:
+        if key in gltf:
+            compact[key] = gltf[key]
+    compact["nodes"] = nodes
+    compact["meshes"] = meshes
+    compact["extensionsUsed"] = [EXTENSION_QUANTIZATION]
+    compact["extensionsRequired"] = [EXTENSION_QUANTIZATION]
+    return write_glb(compact, builder.finish(compact))
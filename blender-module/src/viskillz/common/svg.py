@@ -0,0 +1,210 @@
+import io
+import re
+import xml.etree.ElementTree as ElementTree
+from typing import Dict, List, Set, Tuple
+from xml.sax.saxutils import quoteattr
+
+NAMESPACE_SVG = "http://www.w3.org/2000/svg"
+
+STYLE_ATTRIBUTES = ["fill", "stroke", "stroke-width", "stroke-opacity", "stroke-linecap", "stroke-linejoin"]
+
+PATTERN_PATH = re.compile(r"[MmLlHhVvZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+Point = Tuple[float, float]
+Segment = Tuple[Point, Point]
+Style = Tuple[Tuple[str, str], ...]
+
+
+def parse_path(d: str) -> List[List[Point]]:
+    """
+    Parses the polylines of a path that consists of straight line commands.
+    :param d: the path data
+    :return: the list of polylines
+    """
+    polylines: List[List[Point]] = []
+    command = "M"
+    x, y = 0.0, 0.0
+    tokens = PATTERN_PATH.findall(d)
+    i = 0
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+            if command in "Zz":
+                if len(polylines) > 0 and len(polylines[-1]) > 0:
+                    x, y = polylines[-1][0]
+                    polylines[-1].append((x, y))
+                continue
+        if command in "Hh":
+            x = float(tokens[i]) + (x if command == "h" else 0)
+            i += 1
+        elif command in "Vv":
+            y = float(tokens[i]) + (y if command == "v" else 0)
+            i += 1
+        elif command in "MmLl":
+            dx, dy = float(tokens[i]), float(tokens[i + 1])
+            x, y = (x + dx, y + dy) if command in "ml" else (dx, dy)
+            i += 2
+        else:
+            raise ValueError(f"Unsupported path command: {command}")
+
+        if command in "Mm":
+            polylines.append([])
+            command = "l" if command == "m" else "L"
+        polylines[-1].append((x, y))
+    return polylines
+
+
+def read_runs(data: bytes) -> Tuple[Dict[str, str], List[Tuple[Style, List[List[Point]]]]]:
+    """
+    Reads the strokes of an SVG document in painting order. Consecutive paths with the same style are merged into a run.
+    :param data: the content of the SVG document
+    :return: the attributes of the root element and the list of runs
+    """
+    root: Dict[str, str] = dict()
+    runs: List[Tuple[Style, List[List[Point]]]] = []
+    for _, element in ElementTree.iterparse(io.BytesIO(data), events=("start",)):
+        tag = element.tag.split("}")[-1]
+        if tag == "svg" and len(root) == 0:
+            root = {key: element.get(key) for key in ["width", "height", "viewBox"] if element.get(key) is not None}
+        elif tag == "path":
+            style = tuple((key, element.get(key)) for key in STYLE_ATTRIBUTES if element.get(key) is not None)
+            polylines = parse_path(element.get("d", ""))
+            if len(runs) > 0 and runs[-1][0] == style:
+                runs[-1][1].extend(polylines)
+            else:
+                runs.append((style, polylines))
+    return root, runs
+
+
+def quantize(point: Point,
+             decimals: int) -> Point:
+    return round(point[0], decimals) + 0.0, round(point[1], decimals) + 0.0
+
+
+def segments(polylines: List[List[Point]],
+             decimals: int) -> Tuple[Set[Segment], Set[Point]]:
+    """
+    Collects the undirected segments of polylines after quantizing their coordinates.
+    Polylines that collapse into a single point are returned as dots, unless the point is covered by a segment.
+    :param polylines: the polylines
+    :param decimals: the number of decimals kept
+    :return: the set of segments and the set of dots
+    """
+    result: Set[Segment] = set()
+    dots: Set[Point] = set()
+    for polyline in polylines:
+        points = [quantize(point, decimals) for point in polyline]
+        for a, b in zip(points, points[1:]):
+            if a != b:
+                result.add((min(a, b), max(a, b)))
+        if len(points) > 0 and all(point == points[0] for point in points):
+            dots.add(points[0])
+    return result, dots - {point for segment in result for point in segment}
+
+
+def chain(segment_set: Set[Segment]) -> List[List[Point]]:
+    """
+    Chains undirected segments into as few polylines as possible, using each segment once. The result is deterministic.
+    :param segment_set: the segments
+    :return: the list of polylines
+    """
+    adjacency: Dict[Point, List[Point]] = dict()
+    for a, b in sorted(segment_set):
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+    for neighbours in adjacency.values():
+        neighbours.reverse()
+
+    starts = [point for point in sorted(adjacency) if len(adjacency[point]) % 2 == 1] + sorted(adjacency)
+    used: Set[Segment] = set()
+    polylines = []
+    for start in starts:
+        polyline = [start]
+        current = start
+        while len(adjacency[current]) > 0:
+            following = adjacency[current].pop()
+            segment = (min(current, following), max(current, following))
+            if segment in used:
+                continue
+            used.add(segment)
+            polyline.append(following)
+            current = following
+        if len(polyline) > 1:
+            polylines.append(polyline)
+    return polylines
+
+
+def format_number(value: float,
+                  decimals: int) -> str:
+    text = f"{value:.{decimals}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def format_path(polylines: List[List[Point]],
+                decimals: int) -> str:
+    return "".join(
+        "M" + " ".join(f"{format_number(x, decimals)},{format_number(y, decimals)}" for x, y in polyline)
+        for polyline in polylines
+    )
+
+
+def compact_svg(data: bytes,
+                decimals: int = 1) -> bytes:
+    """
+    Creates a compact version of a Freestyle SVG document. Metadata and groups are stripped, the coordinates are
+    quantized, each run of paths with the same style is merged into a single path, retraced segments are removed and
+    the remaining segments are chained into polylines. The painting order of the runs is kept.
+    :param data: the content of the SVG document
+    :param decimals: the number of decimals kept
+    :return: the content of the compact SVG document
+    """
+    root, runs = read_runs(data)
+    elements = []
+    for style, polylines in runs:
+        segment_set, dots = segments(polylines, decimals)
+        polylines = chain(segment_set) + [[dot, dot] for dot in sorted(dots)]
+        if len(polylines) > 0:
+            attributes = "".join(f" {key}={quoteattr(value)}" for key, value in style)
+            elements.append(f'<path{attributes} d="{format_path(polylines, decimals)}"/>')
+
+    attributes = "".join(f" {key}={quoteattr(value)}" for key, value in root.items())
+    return f'<svg xmlns="{NAMESPACE_SVG}" version="1.1"{attributes}>{"".join(elements)}</svg>'.encode("ascii")
+
+
+def drawing(data: bytes,
+            decimals: int) -> Tuple[Dict[str, str], List[Tuple[Style, Set[Segment], Set[Point]]]]:
+    """
+    Describes what an SVG document draws: the root attributes and the quantized segments and dots of each
+    non-empty run.
+    :param data: the content of the SVG document
+    :param decimals: the number of decimals kept
+    :return: the description
+    """
+    root, runs = read_runs(data)
+    result = []
+    for style, polylines in runs:
+        segment_set, dots = segments(polylines, decimals)
+        if len(segment_set) > 0 or len(dots) > 0:
+            if len(result) > 0 and result[-1][0] == style:
+                result[-1][1].update(segment_set)
+                result[-1][2].update(dots)
+            else:
+                result.append((style, segment_set, dots))
+    return root, result
+
+
+def verify_svg(original: bytes,
+               compact: bytes,
+               decimals: int = 1) -> bool:
+    """
+    Checks whether a compact SVG document is visually equivalent to the original one, i.e., it has the same size and
+    draws the same quantized segments with the same styles in the same order.
+    :param original: the content of the original SVG document
+    :param compact: the content of the compact SVG document
+    :param decimals: the number of decimals kept
+    :return: the result
+    """
+    return drawing(original, decimals) == drawing(compact, decimals)
@@ -0,0 +1,165 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+from viskillz.common.archive import EXTENSION_INDEX, ArchiveReader, ArchiveWriter, archive_path
+from viskillz.common.file import init_dir
+from viskillz.common.svg import compact_svg, verify_svg
+
+HEADING_COMPACT_GROUP = "\t".join([f"{'time':<9}", f"{'group':<16}", f"{'new':>7}", f"{'err':>3}", f"{'ratio':>5}"])
+
+reader: Optional[ArchiveReader] = None
+
+Task = Tuple[str, Optional[str], Optional[str], int, bool]
+Result = Tuple[str, int, int, Optional[bytes], bool]
+
+
+def init_worker(path_archive: Optional[str]) -> None:
+    """
+    Opens the source archive in a worker process.
+    :param path_archive: the path of the source archive, None if the sources are separate files
+    :return: nothing
+    """
+    global reader
+    if path_archive is not None:
+        reader = ArchiveReader(path_archive)
+
+
+def compact_entry(task: Task) -> Result:
+    """
+    Compacts and verifies an SVG document. If the target path is given, the result is written to it directly,
+    otherwise it is returned to be appended to the archive.
+    :param task: the name, the source path, the target path, the number of decimals and the verification flag
+    :return: the name, the original size, the compact size, the compact document (None if it has been written) and
+        the verification result
+    """
+    name, path_src, path_dst, decimals, verify = task
+    if path_src is None:
+        data = reader.read(name)
+    else:
+        with open(path_src, "rb") as file:
+            data = file.read()
+
+    compact = compact_svg(data, decimals)
+    if verify and not verify_svg(data, compact, decimals):
+        return name, len(data), len(compact), None, False
+
+    if path_dst is None:
+        return name, len(data), len(compact), compact, True
+
+    with open(path_dst, "wb") as file:
+        file.write(compact)
+    return name, len(data), len(compact), None, True
+
+
+def file_tasks(path_src: str,
+               path_dst: str,
+               decimals: int,
+               verify: bool) -> Iterator[Task]:
+    """
+    Yields the SVG documents of a directory that have no up-to-date compact version yet.
+    :param path_src: the source directory
+    :param path_dst: the target directory
+    :param decimals: the number of decimals kept
+    :param verify: whether the compact documents should be verified or not
+    :return: the tasks
+    """
+    with os.scandir(path_src) as entries:
+        for entry in entries:
+            if entry.name.endswith(".svg"):
+                target = os.path.join(path_dst, entry.name)
+                try:
+                    if os.stat(target).st_mtime >= entry.stat().st_mtime:
+                        continue
+                except FileNotFoundError:
+                    pass
+                yield entry.name, entry.path, target, decimals, verify
+
+
+def archive_tasks(source: ArchiveReader,
+                  target: Optional[ArchiveReader],
+                  decimals: int,
+                  verify: bool) -> Iterator[Task]:
+    """
+    Yields the SVG documents of an archive that are missing from the target archive.
+    :param source: the source archive
+    :param target: the target archive, None if it does not exist yet
+    :param decimals: the number of decimals kept
+    :param verify: whether the compact documents should be verified or not
+    :return: the tasks
+    """
+    for name in source:
+        if name.endswith(".svg") and (target is None or name not in target):
+            yield name, None, None, decimals, verify
+
+
+def compact_group(path_src: str,
+                  path_dst: str,
+                  group_id: str,
+                  workers: Optional[int] = None,
+                  decimals: int = 1,
+                  verify: bool = True,
+                  window: int = 1024) -> None:
+    """
+    Compacts the new SVG documents of a group using a process pool. If the source of the group is a packed archive,
+    the compact documents are appended to a packed archive, otherwise they are written to separate files.
+    At most the given number of documents are in progress at the same time, thus the directory is streamed.
+    :param path_src: the output directory of the group in goal scenarios-2d
+    :param path_dst: the output directory of the group
+    :param group_id: the ID of the group
+    :param workers: the number of worker processes, None for the number of processors
+    :param decimals: the number of decimals kept
+    :param verify: whether the compact documents should be verified or not
+    :param window: the maximal number of documents in progress
+    :return: nothing
+    """
+    init_dir(path_dst, False)
+    source = archive_path(path_src, group_id)
+    target = archive_path(path_dst, group_id)
+    packed = os.path.exists(source + EXTENSION_INDEX)
+
+    writer = None
+    if packed:
+        with ArchiveReader(source) as source_reader:
+            target_reader = ArchiveReader(target) if os.path.exists(target + EXTENSION_INDEX) else None
+            tasks = list(archive_tasks(source_reader, target_reader, decimals, verify))
+            if target_reader is not None:
+                target_reader.close()
+        writer = ArchiveWriter(target)
+    else:
+        tasks = file_tasks(path_src, path_dst, decimals, verify)
+
+    print(HEADING_COMPACT_GROUP)
+    count, errors, size_src, size_dst = 0, 0, 0, 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(source if packed else None,)) as executor:
+        pending: deque[Future] = deque()
+
+        def collect(future: Future) -> None:
+            nonlocal count, errors, size_src, size_dst
+            name, size, size_compact, compact, correct = future.result()
+            if not correct:
+                errors += 1
+                print(f"{name}: the compact document is not equivalent to the original one")
+                return
+            if writer is not None:
+                writer.add(name, compact)
+            count += 1
+            size_src += size
+            size_dst += size_compact
+
+        for task in tasks:
+            pending.append(executor.submit(compact_entry, task))
+            if len(pending) >= window:
+                collect(pending.popleft())
+        for future in pending:
+            collect(future)
+
+    if writer is not None:
+        writer.close()
+
+    ratio = f"{size_dst / size_src:.2f}" if size_src > 0 else "-"
+    print("\t".join([datetime.now().strftime("%H:%M:%S"), f"{group_id:<16}", f"{count:>7}", f"{errors:>3}",
+                     f"{ratio:>5}"]))
@@ -0,0 +1,112 @@
+import json
+import os
+from datetime import datetime
+from multiprocessing import Pool
+from typing import Optional, Tuple
+
+from viskillz.blender.constants import HEADING_PERMUTE_SHAPE, get_case_id, get_scaled_name, plane_vectors, \
+    rotation_vectors, scale_vectors
+from viskillz.common.answers import EMPTY, same_answers
+from viskillz.common.file import init_dir
+from viskillz.offline.geometry import answer_edges
+from viskillz.offline.snapshot import Snapshot, load_snapshot
+
+snapshot: Optional[Snapshot] = None
+
+
+def init_worker(path_snapshot: str) -> None:
+    """
+    Loads the snapshot in a worker process.
+    :param path_snapshot: the path of the snapshot
+    :return: nothing
+    """
+    global snapshot
+    snapshot = load_snapshot(path_snapshot)
+
+
+def export_group(path_snapshot: str,
+                 path: str,
+                 group_id: str,
+                 workers: Optional[int] = None,
+                 path_reference: Optional[str] = None) -> None:
+    """
+    Exports the intersections of the scaled permutations of the shapes of a group.
+    :param path_snapshot: the path of the snapshot
+    :param path: the output directory
+    :param group_id: the ID of the group
+    :param workers: the number of worker processes
+    :param path_reference: the directory of the intersections of the group exported by Blender, if the results should
+        be compared with them
+    :return: nothing
+    """
+    shape_ids = load_snapshot(path_snapshot).shape_ids(group_id)
+    tasks = [(path, shape_id, i, path_reference) for shape_id in shape_ids for i in range(len(scale_vectors()))]
+
+    init_dir(path, False)
+    print(HEADING_PERMUTE_SHAPE)
+    with Pool(workers, initializer=init_worker, initargs=(path_snapshot,)) as pool:
+        for log_buffer in pool.imap(export_shape, tasks):
+            print("\t".join(log_buffer))
+
+
+def export_shape(task: Tuple[str, str, int, Optional[str]]) -> list[str]:
+    """
+    Exports the intersections of a scaled permutation of a shape. If a reference directory is given, each
+    intersection is compared with the one exported by Blender, and the mismatching cases are printed.
+    :param task: the output directory, the name of the shape, the index of the scaling vector and the reference
+        directory
+    :return: the log entry
+    """
+    path_root, original_name, scale_index, path_reference = task
+    mesh = snapshot.meshes[original_name]
+    vector = scale_vectors()[scale_index]
+    shape_name = get_scaled_name(original_name, vector)
+    vertices = mesh.vertices * vector
+
+    planes = plane_vectors(scale=20)
+    log_buffer = [datetime.now().strftime("%H:%M:%S"), shape_name]
+    empty_count = 0
+    correct_count = 0
+
+    json_buffer = dict()
+    for rotation in rotation_vectors():
+        for index in [1, 2, 10, 16, 20]:
+            case_id = get_case_id("F{:02d}".format(index), rotation)
+            try:
+                json_buffer[case_id] = answer_edges(vertices, mesh.polygons, mesh.polygon_offsets, rotation,
+                                                    planes[index - 1], ratio_value=20.0)
+                correct_count += 1
+            except ValueError:
+                json_buffer[case_id] = EMPTY
+                empty_count += 1
+
+    with open(os.path.join(path_root, f"{shape_name}.json"), "w") as file:
+        json.dump(json_buffer, file)
+    return log_buffer + [str(correct_count), str(empty_count), "-", "-", compare_reference(path_reference, shape_name,
+                                                                                          json_buffer)]
+
+
+def compare_reference(path_reference: Optional[str],
+                      shape_name: str,
+                      json_buffer: dict) -> str:
+    """
+    Compares the intersections of a scaled shape with the ones exported by Blender.
+    :param path_reference: the directory of the intersections exported by Blender, or None
+    :param shape_name: the name of the scaled shape
+    :param json_buffer: the intersections by their case IDs
+    :return: the number of mismatching cases, or "-" if there is no reference
+    :raises FileNotFoundError: if the reference directory has no intersections for the shape
+    """
+    if path_reference is None:
+        return "-"
+
+    path = os.path.join(path_reference, f"{shape_name}.json")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Missing reference intersections of shape {shape_name}: {path}")
+    with open(path) as file:
+        reference = json.load(file)
+    mismatches = [case_id for case_id, edges in json_buffer.items()
+                  if case_id not in reference or not same_answers(edges, reference[case_id])]
+    for case_id in mismatches:
+        print(f"Mismatch: {shape_name} {case_id}")
+    return str(len(mismatches))
@@ -0,0 +1,124 @@
+import os
+from multiprocessing import Pool
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from viskillz.blender.constants import get_scaled_name, rotation_vectors, scale_vectors, scenario_file_name
+from viskillz.common.archive import ArchiveWriter, archive_path
+from viskillz.common.glb import PROFILE_COMPACT, TARGET_ARRAY_BUFFER, BufferBuilder, compact_glb, \
+    write_glb
+from viskillz.offline.geometry import AXES_GLTF, euler_matrix
+from viskillz.offline.snapshot import Mesh, Snapshot, load_snapshot
+
+snapshot: Optional[Snapshot] = None
+
+
+def init_worker(path_snapshot: str) -> None:
+    """
+    Loads the snapshot in a worker process.
+    :param path_snapshot: the path of the snapshot
+    :return: nothing
+    """
+    global snapshot
+    snapshot = load_snapshot(path_snapshot)
+
+
+def node_matrix(matrix: np.ndarray) -> List[float]:
+    """
+    Converts a world matrix of Blender to a glTF node matrix, i.e., to a column-major matrix with Y-up axes.
+    :param matrix: the world matrix
+    :return: the node matrix
+    """
+    axes = np.identity(4)
+    axes[:3, :3] = AXES_GLTF
+    return (axes @ matrix @ axes.T).T.flatten().tolist()
+
+
+def build_glb(objects: List[Tuple[str, str, np.ndarray, np.ndarray, np.ndarray]]) -> bytes:
+    """
+    Builds a GLB document containing the given objects with positions and indices only, like Blender's glTF exporter
+    with its default Y-up conversion.
+    :param objects: the name of the node, the name of the mesh, the local coordinates of the vertices, the triangles
+    and the world matrix of each object
+    :return: the content of the GLB document
+    """
+    builder = BufferBuilder()
+    gltf = {
+        "asset": {"generator": "viskillz offline exporter", "version": "2.0"},
+        "scene": 0,
+        "scenes": [{"name": "Scene", "nodes": list(range(len(objects)))}],
+        "nodes": [],
+        "meshes": []
+    }
+    for node_name, mesh_name, vertices, triangles, matrix in objects:
+        positions = builder.add_accessor([tuple(v) for v in (vertices @ AXES_GLTF.T).astype(np.float32).tolist()],
+                                         5126, "VEC3", TARGET_ARRAY_BUFFER, bounds=True)
+        indices = builder.add_indices(triangles.flatten().tolist())
+        gltf["meshes"].append({
+            "name": mesh_name,
+            "primitives": [{"attributes": {"POSITION": positions}, "indices": indices}]
+        })
+        gltf["nodes"].append({"matrix": node_matrix(matrix), "mesh": len(gltf["meshes"]) - 1, "name": node_name})
+    return write_glb(gltf, builder.finish(gltf))
+
+
+def export_group(path_snapshot: str,
+                 path_out: str,
+                 group_id: str,
+                 packed: bool = False,
+                 profile: str = PROFILE_COMPACT,
+                 workers: Optional[int] = None) -> None:
+    """
+    Exports the GLB assets of the scenarios of a group. Only profile compact is supported, since the snapshot contains
+    neither the normals nor the materials that the assets of the default profile contain.
+    :param path_snapshot: the path of the snapshot
+    :param path_out: the output directory
+    :param group_id: the ID of the group
+    :param packed: whether the assets should be written into a packed archive or not
+    :param profile: the export profile
+    :param workers: the number of worker processes
+    :return: nothing
+    """
+    if profile != PROFILE_COMPACT:
+        raise ValueError(f"Profile {profile} is not supported without Blender (supported: {PROFILE_COMPACT}).")
+
+    shape_ids = load_snapshot(path_snapshot).shape_ids(group_id)
+    tasks = [(path_out, shape_id, i, packed) for shape_id in shape_ids for i in range(len(scale_vectors()))]
+
+    archive = ArchiveWriter(archive_path(path_out, group_id)) if packed else None
+    with Pool(workers, initializer=init_worker, initargs=(path_snapshot,)) as pool:
+        for documents in pool.imap(export_shape, tasks):
+            for name, data in documents:
+                archive.add(name, data)
+    if archive is not None:
+        archive.close()
+
+
+def export_shape(task: Tuple[str, str, int, bool]) -> List[Tuple[str, bytes]]:
+    path_out, original_name, scale_index, packed = task
+    mesh: Mesh = snapshot.meshes[original_name]
+    vector = scale_vectors()[scale_index]
+    shape_id = get_scaled_name(original_name, vector)
+    vertices = mesh.vertices * vector
+    scale = np.linalg.norm(mesh.matrix[:3, :3], axis=0)
+
+    documents = []
+    for frame in range(1, 32):
+        frame_mesh = snapshot.meshes[f"R{str(frame).zfill(2)}"]
+        for rotation in rotation_vectors():
+            matrix = np.identity(4)
+            matrix[:3, :3] = euler_matrix(rotation) * scale
+            data = build_glb([
+                (shape_id, mesh.mesh_name, vertices, mesh.triangles, matrix),
+                (frame_mesh.name, frame_mesh.mesh_name, frame_mesh.vertices, frame_mesh.triangles, frame_mesh.matrix)
+            ])
+            data = compact_glb(data)
+
+            name = scenario_file_name(shape_id, rotation, frame) + ".glb"
+            if packed:
+                documents.append((name, data))
+            else:
+                with open(os.path.join(path_out, name), "wb") as file:
+                    file.write(data)
+    return documents
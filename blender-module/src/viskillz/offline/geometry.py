@@ -0,0 +1,144 @@
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+AXES_GLTF = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, -1.0, 0.0]])
+
+
+def euler_matrix(rotation: Sequence[float]) -> np.ndarray:
+    """
+    Calculates the matrix of an Euler rotation with ZYX order, as applied by rotate_global.
+    :param rotation: the rotation vector
+    :return: the rotation matrix
+    """
+    x, y, z = [math.radians(r) for r in rotation]
+    rot_x = np.array([[1, 0, 0], [0, math.cos(x), -math.sin(x)], [0, math.sin(x), math.cos(x)]])
+    rot_y = np.array([[math.cos(y), 0, math.sin(y)], [0, 1, 0], [-math.sin(y), 0, math.cos(y)]])
+    rot_z = np.array([[math.cos(z), -math.sin(z), 0], [math.sin(z), math.cos(z), 0], [0, 0, 1]])
+    return rot_x @ rot_y @ rot_z
+
+
+def section_segments(vertices: np.ndarray,
+                     polygons: np.ndarray,
+                     polygon_offsets: np.ndarray,
+                     co: Sequence[float],
+                     no: Sequence[float],
+                     threshold: float = 0.0001) -> np.ndarray:
+    """
+    Intersects the polygons of a mesh with a plane. Each polygon contributes the segments of the intersection line
+    that lie inside it, like the cut edges of Blender's bisect operator. Vertices closer to the plane than the
+    threshold are considered to be on the plane. Polygons lying in the plane are kept by the bisect operator, thus
+    the boundary edges of the coplanar region are added to the segments, and the segments found twice are merged.
+    :param vertices: the coordinates of the vertices
+    :param polygons: the flattened vertex indices of the polygons
+    :param polygon_offsets: the offsets of the polygons in the flattened indices, closed by the number of indices
+    :param co: the pivot coordinate of the plane
+    :param no: the normal vector of the plane
+    :param threshold: the distance threshold
+    :return: the array of segments, having a shape of (count, 2, 3)
+    """
+    no = np.asarray(no, dtype=float)
+    distances = vertices @ no - np.dot(co, no)
+    distances[np.abs(distances) < threshold * np.linalg.norm(no)] = 0
+    positive = distances >= 0
+
+    sizes = np.diff(polygon_offsets)
+    polygon_ids = np.repeat(np.arange(len(sizes)), sizes)
+    following = np.arange(len(polygons)) + 1
+    following[polygon_offsets[1:] - 1] = polygon_offsets[:-1]
+    a, b = polygons, polygons[following]
+
+    face_normals = np.zeros((len(sizes), 3))
+    np.add.at(face_normals, polygon_ids, np.cross(vertices[a], vertices[b]))
+
+    crossing = positive[a] != positive[b]
+    a, b, polygon_ids = a[crossing], b[crossing], polygon_ids[crossing]
+    t = distances[a] / (distances[a] - distances[b])
+    points = vertices[a] + (vertices[b] - vertices[a]) * t[:, None]
+
+    directions = np.cross(no, face_normals[polygon_ids])
+    order = np.lexsort((np.einsum("ij,ij->i", points, directions), polygon_ids))
+    segments = np.concatenate([points[order].reshape((-1, 2, 3)), coplanar_edges(vertices, polygons, polygon_offsets,
+                                                                                 distances == 0)])
+    segments = segments[np.linalg.norm(segments[:, 0] - segments[:, 1], axis=1) >= threshold]
+    return unique_segments(segments, threshold)
+
+
+def coplanar_edges(vertices: np.ndarray,
+                   polygons: np.ndarray,
+                   polygon_offsets: np.ndarray,
+                   on_plane: np.ndarray) -> np.ndarray:
+    """
+    Collects the boundary edges of the region formed by the polygons whose vertices are all on the plane, i.e., the
+    edges that belong to exactly one such polygon.
+    :param vertices: the coordinates of the vertices
+    :param polygons: the flattened vertex indices of the polygons
+    :param polygon_offsets: the offsets of the polygons in the flattened indices, closed by the number of indices
+    :param on_plane: the flags of the vertices being on the plane
+    :return: the array of edges, having a shape of (count, 2, 3)
+    """
+    sizes = np.diff(polygon_offsets)
+    coplanar = np.logical_and.reduceat(on_plane[polygons], polygon_offsets[:-1]) & (sizes > 0)
+    if not coplanar.any():
+        return np.empty((0, 2, 3))
+
+    following = np.arange(len(polygons)) + 1
+    following[polygon_offsets[1:] - 1] = polygon_offsets[:-1]
+    loops = np.repeat(coplanar, sizes)
+    edges = np.sort(np.column_stack([polygons[loops], polygons[following][loops]]), axis=1)
+    edges, counts = np.unique(edges, axis=0, return_counts=True)
+    return vertices[edges[counts == 1]]
+
+
+def unique_segments(segments: np.ndarray,
+                    threshold: float) -> np.ndarray:
+    """
+    Removes the repeated segments, regardless of their direction. Endpoints closer than the threshold are considered
+    to be the same.
+    :param segments: the array of segments, having a shape of (count, 2, 3)
+    :param threshold: the distance threshold
+    :return: the array of the first occurrences of the segments
+    """
+    if len(segments) < 2:
+        return segments
+
+    keys = np.round(segments / threshold).astype(np.int64)
+    difference = keys[:, 1] - keys[:, 0]
+    swapped = difference[np.arange(len(keys)), np.argmax(difference != 0, axis=1)] < 0
+    keys[swapped] = keys[swapped][:, ::-1]
+    _, indices = np.unique(keys.reshape((-1, 6)), axis=0, return_index=True)
+    return segments[np.sort(indices)]
+
+
+def answer_edges(vertices: np.ndarray,
+                 polygons: np.ndarray,
+                 polygon_offsets: np.ndarray,
+                 rotation: Sequence[float],
+                 plane: List[Tuple[float, float, float]],
+                 ratio_value: float = 2.0,
+                 threshold: float = 0.0001) -> List[Tuple[Tuple[float, float], Tuple[float, float]]]:
+    """
+    Calculates the contour of an intersection like create_answer and contour_edges: the shape is rotated and scaled,
+    intersected with the plane, rotated with the plane's own rotation, moved to the center of the camera and scaled
+    to fit the given size.
+    :param vertices: the local coordinates of the vertices of the shape
+    :param polygons: the flattened vertex indices of the polygons
+    :param polygon_offsets: the offsets of the polygons in the flattened indices, closed by the number of indices
+    :param rotation: the rotation vector
+    :param plane: the pivot coordinate, the normal vector and the rotation vector of the plane
+    :param ratio_value: the scaling factor
+    :param threshold: the distance threshold in local coordinates
+    :return: the list of edges
+    """
+    co, no, diff = plane
+    world = vertices @ euler_matrix(rotation).T * ratio_value
+    segments = section_segments(world, polygons, polygon_offsets, co, no, threshold * ratio_value)
+    if len(segments) == 0:
+        raise ValueError("The plane does not intersect the shape.")
+
+    coordinates = (segments @ euler_matrix(diff).T)[..., :2]
+    lower = coordinates.reshape((-1, 2)).min(axis=0)
+    upper = coordinates.reshape((-1, 2)).max(axis=0)
+    coordinates = (coordinates - (lower + upper) / 2) * (ratio_value / (upper - lower).max())
+    return [((a[0], a[1]), (b[0], b[1])) for a, b in coordinates.tolist()]
@@ -0,0 +1,32 @@
+import sys
+
+from viskillz.common.cli import option
+from viskillz.common.glb import PROFILE_COMPACT
+from viskillz.offline import compact_svg, export_answers, export_glb, similarity
+
+
+def run() -> None:
+    args = sys.argv[1:]
+    workers = int(option(args, "-workers", "0")) or None
+    if args[0] == "-svg":
+        compact_svg.compact_group(path_src=args[1], path_dst=args[2], group_id=args[3], workers=workers,
+                                  decimals=int(option(args, "-decimals", "1")), verify="-noverify" not in args)
+    elif args[0] == "-ans":
+        export_answers.export_group(path_snapshot=option(args, "-snapshot", ""), path=args[1], group_id=args[2],
+                                    workers=workers, path_reference=option(args, "-reference", None))
+    elif args[0] == "-sim":
+        similarity.build_index(path_src=args[1], path_out=args[2], group_ids=option(args, "-groups", "").split(","),
+                               workers=workers)
+    elif args[0] == "-near":
+        index = similarity.load_index(args[1])
+        for shape_name, case_id, distance in index.query(args[2], args[3], count=int(option(args, "-count", "10")),
+                                                         same_shape="-othershapes" not in args):
+            print(f"{shape_name:<16}\t{case_id}\t{distance:.4f}")
+    elif args[0] == "-3d":
+        export_glb.export_group(path_snapshot=option(args, "-snapshot", ""), path_out=args[1], group_id=args[2],
+                                packed="-pack" in args, profile=option(args, "-profile", PROFILE_COMPACT),
+                                workers=workers)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,400 @@
+import json
+import math
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing import Pool
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from viskillz.common.answers import EMPTY
+
+INDEX_VERSION = 2
+
+HARMONICS = 16
+BINS = 12
+RATIOS = 4
+TRIPLES = [(1, 1), (1, 2), (1, 3), (2, 2)]
+BLOCKS = [HARMONICS, len(TRIPLES), RATIOS, BINS]
+BLOCK_WEIGHTS = [1.0, 0.1, 1.0, 1.0]
+
+HEADING_INDEX_GROUP = "\t".join([f"{'time':<9}", f"{'group':<16}", f"{'shapes':>6}", f"{'cases':>7}", f"{'empty':>7}"])
+
+
+def contour_loops(edges: Sequence[Tuple[Tuple[float, float], Tuple[float, float]]],
+                  decimals: int = 4) -> List[np.ndarray]:
+    """
+    Chains the unordered edges of a contour into polylines. Endpoints are considered to be the same if they are equal
+    after rounding.
+    :param edges: the list of edges
+    :param decimals: the number of decimals used in the comparison of the endpoints
+    :return: the list of polylines, each of them represented by the coordinates of its vertices
+    """
+    points, neighbours = dict(), dict()
+    for edge in edges:
+        keys = [tuple(round(c, decimals) for c in point) for point in edge]
+        if keys[0] == keys[1]:
+            continue
+        for key, point, other in [(keys[0], edge[0], keys[1]), (keys[1], edge[1], keys[0])]:
+            points.setdefault(key, point)
+            neighbours.setdefault(key, []).append(other)
+
+    loops = []
+    for start in points:
+        while neighbours[start]:
+            loop, current = [start], neighbours[start].pop()
+            neighbours[current].remove(start)
+            while current != start:
+                loop.append(current)
+                if not neighbours[current]:
+                    break
+                following = neighbours[current].pop()
+                neighbours[following].remove(current)
+                current = following
+            loops.append(np.array([points[key] for key in loop], dtype=float))
+    return [loop for loop in loops if len(loop) >= 3]
+
+
+def cross(a: np.ndarray,
+          b: np.ndarray) -> np.ndarray:
+    """
+    Calculates the cross products of 2D vectors.
+    :param a: the first vectors
+    :param b: the second vectors
+    :return: the Z components of the cross products
+    """
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+def signed_area(loop: np.ndarray) -> float:
+    """
+    Calculates the signed area of a closed polygon, which is positive if its orientation is counter-clockwise.
+    :param loop: the coordinates of the vertices
+    :return: the signed area
+    """
+    x, y = loop[:, 0], loop[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y)) / 2
+
+
+def simplify_loop(loop: np.ndarray,
+                  tolerance: float = 1e-6) -> np.ndarray:
+    """
+    Removes the vertices of a closed polygon at which its boundary does not turn.
+    :param loop: the coordinates of the vertices
+    :param tolerance: the minimal sine of the turning angle
+    :return: the coordinates of the remaining vertices
+    """
+    while len(loop) > 3:
+        incoming, outgoing = loop - np.roll(loop, 1, axis=0), np.roll(loop, -1, axis=0) - loop
+        lengths = np.linalg.norm(incoming, axis=1) * np.linalg.norm(outgoing, axis=1)
+        sines = np.abs(cross(incoming, outgoing)) / np.maximum(lengths, 1e-12)
+        straight = (sines < tolerance) & (np.einsum("ij,ij->i", incoming, outgoing) > 0)
+        if not straight.any():
+            break
+        loop = loop[~straight]
+    return loop
+
+
+def turning_angles(loop: np.ndarray) -> np.ndarray:
+    """
+    Calculates the signed turning angles at the vertices of a closed polygon.
+    :param loop: the coordinates of the vertices
+    :return: the turning angles, positive at convex vertices of a counter-clockwise polygon
+    """
+    incoming, outgoing = loop - np.roll(loop, 1, axis=0), np.roll(loop, -1, axis=0) - loop
+    return np.arctan2(cross(incoming, outgoing), np.einsum("ij,ij->i", incoming, outgoing))
+
+
+def turning_coefficients(loop: np.ndarray,
+                         harmonics: int = HARMONICS) -> np.ndarray:
+    """
+    Calculates the Fourier coefficients of the turning function of a counter-clockwise polygon. The turning function
+    jumps by the turning angle at each vertex, thus the coefficients of its derivative are the sums of the turning
+    angles weighted by the phases of the arc length positions of the vertices. They are invariant to translation,
+    rotation and scaling, while changing the starting vertex shifts their phases.
+    :param loop: the coordinates of the vertices
+    :param harmonics: the number of coefficients, not counting the constant one
+    :return: the coefficients
+    """
+    lengths = np.linalg.norm(loop - np.roll(loop, 1, axis=0), axis=1)
+    positions = np.cumsum(lengths) / lengths.sum()
+    phases = np.exp(-2j * math.pi * np.outer(np.arange(1, harmonics + 1), positions))
+    return phases @ turning_angles(loop) / (2 * math.pi)
+
+
+def chirality(coefficients: np.ndarray) -> np.ndarray:
+    """
+    Calculates the handedness of a polygon from the Fourier coefficients of its turning function: the imaginary parts
+    of the products c(a) * c(b) * conj(c(a + b)) for the pairs of TRIPLES. The products do not depend on the starting
+    vertex, while mirroring the polygon conjugates them, thus these values change their signs. They are zero for
+    symmetric polygons.
+    :param coefficients: the coefficients of the harmonics 1, 2, ...
+    :return: the values
+    """
+    return np.array([(coefficients[a - 1] * coefficients[b - 1] * np.conj(coefficients[a + b - 1])).imag
+                     for a, b in TRIPLES])
+
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """
+    Calculates the convex hull of a set of points with the monotone chain algorithm.
+    :param points: the coordinates of the points
+    :return: the coordinates of the vertices of the hull in counter-clockwise order
+    """
+    points = np.unique(points, axis=0)
+    if len(points) < 3:
+        return points
+
+    def chain(ordered: np.ndarray) -> List[np.ndarray]:
+        hull = []
+        for point in ordered:
+            while len(hull) >= 2 and cross(hull[-1] - hull[-2], point - hull[-2]) <= 0:
+                hull.pop()
+            hull.append(point)
+        return hull[:-1]
+
+    return np.array(chain(points) + chain(points[::-1]))
+
+
+def contains(loop: np.ndarray,
+             point: np.ndarray) -> bool:
+    """
+    Determines whether a point is inside a closed polygon with the even-odd rule.
+    :param loop: the coordinates of the vertices
+    :param point: the coordinates of the point
+    :return: the result
+    """
+    a, b = loop, np.roll(loop, -1, axis=0)
+    crossing = (a[:, 1] > point[1]) != (b[:, 1] > point[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = a[:, 0] + (point[1] - a[:, 1]) * (b[:, 0] - a[:, 0]) / (b[:, 1] - a[:, 1])
+    return bool(np.count_nonzero(crossing & (x > point[0])) % 2)
+
+
+def descriptor(edges: Sequence[Tuple[Tuple[float, float], Tuple[float, float]]]) -> Optional[np.ndarray]:
+    """
+    Calculates the translation, rotation and scale invariant descriptor of the contour of an intersection:
+    the spectrum and the chirality of the turning function of its largest polygon, the ratios of its area and
+    perimeter (isoperimetric quotient, convexity, hull perimeter ratio, number of additional polygons), and the
+    histogram of the interior angles of all its polygons. The bins of the histogram are centered on the multiples of
+    360 / BINS degrees, so that the frequent right angles are not split by floating-point noise. Only the chirality
+    distinguishes a contour from its mirror image.
+    :param edges: the list of edges
+    :return: the descriptor, or None if the contour contains no polygon
+    """
+    loops = [simplify_loop(loop) for loop in contour_loops(edges)]
+    loops = [loop for loop in loops if len(loop) >= 3 and abs(signed_area(loop)) > 0]
+    if not loops:
+        return None
+
+    loops.sort(key=lambda loop: -abs(signed_area(loop)))
+    oriented = []
+    for i, loop in enumerate(loops):
+        depth = sum(contains(outer, loop[0]) for outer in loops[:i])
+        counter_clockwise = depth % 2 == 0
+        oriented.append(loop if (signed_area(loop) > 0) == counter_clockwise else loop[::-1])
+
+    area = sum(signed_area(loop) for loop in oriented)
+    perimeter = sum(np.linalg.norm(loop - np.roll(loop, 1, axis=0), axis=1).sum() for loop in oriented)
+    hull = convex_hull(np.vstack(oriented))
+    hull_perimeter = np.linalg.norm(hull - np.roll(hull, 1, axis=0), axis=1).sum()
+    ratios = [
+        4 * math.pi * area / perimeter ** 2,
+        area / max(signed_area(hull), 1e-12),
+        hull_perimeter / perimeter,
+        min(len(oriented) - 1, 3) / 3
+    ]
+
+    angles = np.concatenate([math.pi - turning_angles(loop) for loop in oriented])
+    histogram, _ = np.histogram(np.mod(angles + math.pi / BINS, 2 * math.pi), bins=BINS, range=(0, 2 * math.pi))
+    coefficients = turning_coefficients(oriented[0])
+    return np.concatenate([np.abs(coefficients), chirality(coefficients), ratios, histogram / len(angles)])
+
+
+@dataclass
+class SimilarityIndex:
+    """
+    The descriptors of the intersections of the answer corpus, standardized and weighted so that the spectrum, the
+    ratios and the histogram contribute equally to the Euclidean distance, while the chirality only separates the
+    mirror images.
+    """
+    shapes: np.ndarray
+    cases: np.ndarray
+    features: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    positions: Dict[Tuple[str, str], int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.positions = {key: i for i, key in enumerate(zip(self.shapes.tolist(), self.cases.tolist()))}
+        self.norms = np.einsum("ij,ij->i", self.features, self.features)
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.positions
+
+    def nearest(self,
+                features: np.ndarray,
+                count: int = 10,
+                identical: float = 0.05,
+                exclude: Optional[str] = None) -> List[Tuple[str, str, float]]:
+        """
+        Returns the nearest intersections to a standardized descriptor, skipping the ones that are near-identical to
+        it or to a nearer result. Thus, the same section of different rotations is returned only once.
+        :param features: the standardized descriptor
+        :param count: the number of intersections
+        :param identical: the distance under which intersections are considered to be identical
+        :param exclude: the name of a scaled shape whose intersections should be skipped
+        :return: the scaled shape, the case ID and the distance of each intersection, in ascending order of distance
+        """
+        distances = np.sqrt(np.maximum(self.norms - 2 * (self.features @ features) + features @ features, 0))
+        distances[distances < identical] = np.inf
+        if exclude is not None:
+            distances[self.shapes == exclude] = np.inf
+
+        results = []
+        while len(results) < count:
+            i = int(np.argmin(distances))
+            if not np.isfinite(distances[i]):
+                break
+            results.append((str(self.shapes[i]), str(self.cases[i]), float(distances[i])))
+            near = np.flatnonzero(np.abs(distances - distances[i]) < identical)
+            distances[near[np.linalg.norm(self.features[near] - self.features[i], axis=1) < identical]] = np.inf
+        return results
+
+    def query(self,
+              shape_name: str,
+              case_id: str,
+              count: int = 10,
+              identical: float = 0.05,
+              same_shape: bool = True) -> List[Tuple[str, str, float]]:
+        """
+        Returns the distractor candidates of an intersection: the most similar intersections that are not identical.
+        :param shape_name: the name of the scaled shape
+        :param case_id: the case ID of the intersection, as returned by get_case_id
+        :param count: the number of candidates
+        :param identical: the distance under which intersections are considered to be identical
+        :param same_shape: tells whether the other intersections of the same scaled shape are candidates or not
+        :return: the scaled shape, the case ID and the distance of each candidate, in ascending order of distance
+        """
+        features = self.features[self.positions[(shape_name, case_id)]]
+        return self.nearest(features, count, identical, None if same_shape else shape_name)
+
+    def query_edges(self,
+                    edges: Sequence[Tuple[Tuple[float, float], Tuple[float, float]]],
+                    count: int = 10,
+                    identical: float = 0.05) -> List[Tuple[str, str, float]]:
+        """
+        Returns the most similar intersections to a contour that is not part of the index.
+        :param edges: the list of edges
+        :param count: the number of intersections
+        :param identical: the distance under which intersections are considered to be identical
+        :return: the scaled shape, the case ID and the distance of each intersection, in ascending order of distance
+        """
+        raw = descriptor(edges)
+        if raw is None:
+            raise ValueError("The contour contains no polygon.")
+        return self.nearest(((raw - self.mean) * self.scale).astype(self.features.dtype), count, identical)
+
+
+def standardize(descriptors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculates the mean and the scale of the descriptors: each feature is divided by its standard deviation, and each
+    block of features by the square root of its length and multiplied by its weight. The chirality has a low weight,
+    thus a chiral contour and its mirror image are not identical, but they are still nearer to each other than to
+    most of the other contours.
+    :param descriptors: the raw descriptors
+    :return: the mean and the scale of each feature
+    """
+    mean = descriptors.mean(axis=0)
+    std = descriptors.std(axis=0)
+    weights = np.concatenate([
+        np.full(length, weight / math.sqrt(length)) for length, weight in zip(BLOCKS, BLOCK_WEIGHTS)
+    ])
+    return mean, np.where(std > 1e-12, weights / np.where(std > 1e-12, std, 1), 0)
+
+
+def save_index(path: str,
+               index: SimilarityIndex) -> None:
+    """
+    Writes a similarity index into a compressed NumPy archive.
+    :param path: the path of the archive
+    :param index: the index
+    :return: nothing
+    """
+    with open(path, "wb") as file:
+        np.savez_compressed(file, version=INDEX_VERSION, shapes=index.shapes, cases=index.cases,
+                            features=index.features, mean=index.mean, scale=index.scale)
+
+
+def load_index(path: str) -> SimilarityIndex:
+    """
+    Reads a similarity index from a compressed NumPy archive.
+    :param path: the path of the archive
+    :return: the index
+    """
+    with np.load(path) as arrays:
+        if int(arrays["version"]) != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {int(arrays['version'])} (expected: {INDEX_VERSION}).")
+        return SimilarityIndex(shapes=arrays["shapes"], cases=arrays["cases"], features=arrays["features"],
+                               mean=arrays["mean"], scale=arrays["scale"])
+
+
+def describe_shape(path: str) -> Tuple[str, List[str], np.ndarray, int]:
+    """
+    Calculates the descriptors of the non-empty intersections of a scaled shape.
+    :param path: the path of the JSON document of the scaled shape
+    :return: the name of the scaled shape, the case IDs, the descriptors and the number of empty intersections
+    """
+    with open(path) as file:
+        answers = json.load(file)
+
+    case_ids, descriptors, empty_count = [], [], 0
+    for case_id, edges in answers.items():
+        raw = None if edges == EMPTY else descriptor(edges)
+        if raw is None:
+            empty_count += 1
+            continue
+        case_ids.append(case_id)
+        descriptors.append(raw)
+    return os.path.basename(path)[:-len(".json")], case_ids, \
+        np.array(descriptors).reshape((-1, sum(BLOCKS))), empty_count
+
+
+def build_index(path_src: str,
+                path_out: str,
+                group_ids: List[str],
+                workers: Optional[int] = None) -> SimilarityIndex:
+    """
+    Builds the similarity index of the intersections exported by goals of type intersections.
+    :param path_src: the output directory of the intersections, containing a subdirectory for each group
+    :param path_out: the path of the index
+    :param group_ids: the IDs of the groups
+    :param workers: the number of worker processes
+    :return: the index
+    """
+    shapes, cases, descriptors = [], [], []
+    print(HEADING_INDEX_GROUP)
+    with Pool(workers) as pool:
+        for group_id in group_ids:
+            path_group = os.path.join(path_src, group_id)
+            paths = sorted(os.path.join(path_group, name) for name in os.listdir(path_group) if name.endswith(".json"))
+            case_count, empty_count = 0, 0
+            for shape_name, case_ids, features, empty in pool.imap(describe_shape, paths, chunksize=4):
+                shapes += [shape_name] * len(case_ids)
+                cases += case_ids
+                descriptors.append(features)
+                case_count += len(case_ids)
+                empty_count += empty
+            print("\t".join([datetime.now().strftime("%H:%M:%S"), f"{group_id:<16}", f"{len(paths):>6}",
+                             f"{case_count:>7}", f"{empty_count:>7}"]))
+
+    raw = np.vstack(descriptors) if descriptors else np.empty((0, sum(BLOCKS)))
+    mean, scale = standardize(raw) if len(raw) > 0 else (np.zeros(sum(BLOCKS)), np.ones(sum(BLOCKS)))
+    index = SimilarityIndex(shapes=np.array(shapes, dtype=str), cases=np.array(cases, dtype=str),
+                            features=((raw - mean) * scale).astype(np.float32), mean=mean, scale=scale)
+    save_index(path_out, index)
+    return index
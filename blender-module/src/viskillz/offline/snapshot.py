@@ -0,0 +1,100 @@
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+SNAPSHOT_VERSION = 1
+
+KIND_SHAPE = "shape"
+KIND_FRAME = "frame"
+
+
+@dataclass
+class Mesh:
+    """
+    A mesh object extracted from the Blender project.
+    """
+    name: str
+    kind: str
+    group: str
+    mesh_name: str
+    vertices: np.ndarray
+    polygons: np.ndarray
+    polygon_offsets: np.ndarray
+    triangles: np.ndarray
+    matrix: np.ndarray
+
+    def polygon_list(self) -> List[np.ndarray]:
+        """
+        Splits the flattened vertex indices of the polygons.
+        :return: the list of polygons, each of them represented by its vertex indices
+        """
+        return np.split(self.polygons, self.polygon_offsets[1:-1])
+
+
+@dataclass
+class Snapshot:
+    """
+    The shapes, frames and cameras of a Blender project, which can be processed without Blender.
+    """
+    meshes: Dict[str, Mesh] = field(default_factory=dict)
+    cameras: Dict[str, dict] = field(default_factory=dict)
+
+    def shape_ids(self, group_id: str) -> List[str]:
+        """
+        Returns the sorted IDs of the shapes of a group.
+        :param group_id: the ID of the group
+        :return: the list of IDs
+        """
+        return sorted(mesh.name for mesh in self.meshes.values()
+                      if mesh.kind == KIND_SHAPE and mesh.group.startswith(group_id))
+
+
+def save_snapshot(path: str,
+                  snapshot: Snapshot) -> None:
+    """
+    Writes a snapshot into a compressed NumPy archive.
+    :param path: the path of the archive
+    :param snapshot: the snapshot
+    :return: nothing
+    """
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "meshes": [
+            {"name": mesh.name, "kind": mesh.kind, "group": mesh.group, "mesh": mesh.mesh_name}
+            for mesh in snapshot.meshes.values()
+        ],
+        "cameras": snapshot.cameras
+    }
+    arrays = {"meta": np.array(json.dumps(meta))}
+    for i, mesh in enumerate(snapshot.meshes.values()):
+        arrays[f"{i}.vertices"] = mesh.vertices
+        arrays[f"{i}.polygons"] = mesh.polygons
+        arrays[f"{i}.polygon_offsets"] = mesh.polygon_offsets
+        arrays[f"{i}.triangles"] = mesh.triangles
+        arrays[f"{i}.matrix"] = mesh.matrix
+    with open(path, "wb") as file:
+        np.savez_compressed(file, **arrays)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Reads a snapshot from a compressed NumPy archive.
+    :param path: the path of the archive
+    :return: the snapshot
+    """
+    with np.load(path) as arrays:
+        meta = json.loads(str(arrays["meta"]))
+        if meta["version"] != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {meta['version']} (expected: {SNAPSHOT_VERSION}).")
+
+        snapshot = Snapshot(cameras=meta["cameras"])
+        for i, entry in enumerate(meta["meshes"]):
+            snapshot.meshes[entry["name"]] = Mesh(
+                name=entry["name"], kind=entry["kind"], group=entry["group"], mesh_name=entry["mesh"],
+                vertices=arrays[f"{i}.vertices"], polygons=arrays[f"{i}.polygons"],
+                polygon_offsets=arrays[f"{i}.polygon_offsets"], triangles=arrays[f"{i}.triangles"],
+                matrix=arrays[f"{i}.matrix"]
+            )
+    return snapshot
@@ -1,27 +1,372 @@
 import asyncio
+import heapq
 import json
 import os
+import re
+import statistics
 import subprocess
 import sys
+import time
 from asyncio import streams
-from datetime import datetime
-from typing import Any, Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
 
 from viskillz.common.log import StageLogger
 from wakepy import keepawake
 
 from viskillz.common.file import init_dir
 
+BACKEND = "backend"
+BACKEND_SNAPSHOT = "snapshot"
 OUT = "out"
 GROUPS = "groups"
+PACKED = "packed"
+PROFILE = "profile"
+PROFILE_DEFAULT = "default"
+PROFILE_COMPACT = "compact"
+PROFILES = [PROFILE_DEFAULT, PROFILE_COMPACT]
+DECIMALS = "decimals"
+VERIFY = "verify"
+REFERENCE = "reference"
+WORKERS = "workers"
+SNAPSHOT = "snapshot"
 SRC = "src"
 TYPE = "type"
 
+RESOURCES = "resources"
+SUMMARY = "summary"
+SCHEDULE = "schedule"
 
-async def call_async(command: list[str]) -> None:
+USAGE_SUMS = ["duration", "user_cpu", "system_cpu", "bytes_written", "files", "bytes_produced"]
+USAGE_MAXIMA = ["peak_rss"]
+
+FILES_PER_SHAPE = {"scenarios-3d": 7 * 24 * 31, "scenarios-2d": 24 * 31, "compact-2d": 24 * 31, "intersections": 7}
+
+PATTERN_GOAL_ID = re.compile(r"\d+-[a-z0-9-]+")
+PATTERN_DURATION = re.compile(r"(?:(\d+) days?, )?(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+BASIS_HISTORY = "history"
+BASIS_SHAPES = "shapes"
+BASIS_GOAL_TYPE = "goal type"
+BASIS_ANY = "any"
+
+
+@dataclass
+class Job:
+    """
+    A single execution of a goal on a group, or on the whole project. A job is started only after the jobs producing
+    its inputs have finished.
+    """
+    goal_id: str
+    goal_type: str
+    group_id: str
+    command: list[str]
+    path_out: str
+    is_async: bool
+    env: Optional[dict] = None
+    requires: list["Job"] = field(default_factory=list)
+    predicted: Optional[float] = None
+    basis: Optional[str] = None
+
+
+def read_proc_usage(pid: int) -> Optional[dict]:
+    """
+    Reads the resource usage of a running process from /proc (Linux only).
+    :param pid: the ID of the process
+    :return: the peak memory, the CPU times and the bytes written so far, or None if they are not available
+    """
+    try:
+        with open(f"/proc/{pid}/status") as file:
+            status = dict(line.split(":", 1) for line in file if ":" in line)
+        with open(f"/proc/{pid}/stat") as file:
+            stat = file.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/io") as file:
+            io = dict(line.split(":", 1) for line in file if ":" in line)
+        ticks = os.sysconf("SC_CLK_TCK")
+        return {
+            "peak_rss": int(status["VmHWM"].split()[0]) * 1024,
+            "user_cpu": int(stat[11]) / ticks,
+            "system_cpu": int(stat[12]) / ticks,
+            "bytes_written": int(io["write_bytes"])
+        }
+    except (OSError, KeyError, ValueError, IndexError):
+        return None
+
+
+async def sample_usage(pid: int,
+                       usage: dict,
+                       interval: float = 0.5) -> None:
+    """
+    Samples the resource usage of a running process periodically until being cancelled.
+    :param pid: the ID of the process
+    :param usage: the dictionary to be updated with the last sample
+    :param interval: the sampling interval in seconds
+    :return: nothing
+    """
+    while True:
+        sample = read_proc_usage(pid)
+        if sample is not None:
+            usage.update(sample)
+        await asyncio.sleep(interval)
+
+
+def call_sync(command: list[str],
+              env: Optional[dict] = None) -> dict:
+    """
+    Executes a command and collects its resource usage with os.wait4 where it is available.
+    :param command: the command
+    :param env: the environment variables of the process
+    :return: the resource usage
+    """
+    process = subprocess.Popen(command, env=env)
+    if not hasattr(os, "wait4"):
+        process.wait()
+        return dict()
+
+    _, status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return {
+        "peak_rss": rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024),
+        "user_cpu": rusage.ru_utime,
+        "system_cpu": rusage.ru_stime,
+        "bytes_written": rusage.ru_oublock * 512
+    }
+
+
+def output_size(path: str) -> tuple[int, int]:
+    """
+    Counts the files and their total size in a directory recursively, or the size of a single file.
+    :param path: the path of the directory or the file
+    :return: the number of files and their total size in bytes
+    """
+    if os.path.isfile(path):
+        return 1, os.path.getsize(path)
+
+    files, size = 0, 0
+    for root, _, names in os.walk(path):
+        for name in names:
+            files += 1
+            size += os.path.getsize(os.path.join(root, name))
+    return files, size
+
+
+def run_job(command: list[str],
+            path_out: str,
+            is_async: bool,
+            env: Optional[dict] = None) -> dict:
+    """
+    Executes a job and measures its resource usage: wall time, peak memory, user and system CPU time,
+    bytes written by the process, and the number and total size of the files produced in its output.
+    Peak memory, CPU time and bytes written are collected with os.wait4 for synchronous jobs, and by sampling /proc for
+    asynchronous ones, thus they are missing on platforms that support neither.
+    :param command: the command
+    :param path_out: the output directory or file of the job
+    :param is_async: whether the output of the job should be filtered asynchronously or not
+    :param env: the environment variables of the process
+    :return: the resource usage
+    """
+    files, size = output_size(path_out)
+    start = time.perf_counter()
+    usage = asyncio.run(call_async(command, env)) if is_async else call_sync(command, env)
+    usage["duration"] = time.perf_counter() - start
+    files_after, size_after = output_size(path_out)
+    usage["files"] = files_after - files
+    usage["bytes_produced"] = size_after - size
+    return usage
+
+
+def summarize_usage(resources: dict) -> dict:
+    """
+    Summarizes the resource usage of the jobs per goal type.
+    :param resources: the resource usage of the jobs, grouped by the formatted goal IDs
+    :return: the totals and maxima per goal type, with the average CPU utilization and the peak memory per job
+    """
+    summary, cpu_durations = dict(), dict()
+    for goal_id, jobs in resources.items():
+        goal_type = goal_id.split("-", 1)[1]
+        entry = summary.setdefault(goal_type, {"jobs": 0})
+        for usage in jobs.values():
+            entry["jobs"] += 1
+            if "user_cpu" in usage:
+                cpu_durations[goal_type] = cpu_durations.get(goal_type, 0) + usage["duration"]
+            for key in USAGE_SUMS:
+                if key in usage:
+                    entry[key] = entry.get(key, 0) + usage[key]
+            for key in USAGE_MAXIMA:
+                if key in usage:
+                    entry[key] = max(entry.get(key, 0), usage[key])
+
+    for goal_type, entry in summary.items():
+        if cpu_durations.get(goal_type, 0) > 0:
+            entry["cpu_utilization"] = (entry["user_cpu"] + entry["system_cpu"]) / cpu_durations[goal_type]
+    return summary
+
+
+def parse_duration(value: str) -> float:
+    """
+    Converts a duration formatted by StageLogger as "[D day(s), ]H:MM:SS[.f]" to seconds.
+    :param value: the formatted duration
+    :return: the duration in seconds
+    """
+    match = PATTERN_DURATION.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid duration: {value!r}.")
+    days, hours, minutes, seconds = match.groups()
+    return int(days or 0) * 86400 + int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+
+def stage_durations(log: dict) -> dict:
+    """
+    Derives the durations of the jobs from the StageLogger entries of a log, which map the groups of each goal to
+    their formatted durations. These are the only timing recorded by the runs preceding the resource accounting.
+    :param log: the log document
+    :return: the durations of the jobs in the format of the resource usage, grouped by the formatted goal IDs
+    """
+    return {
+        goal_id: {group_id: {"duration": parse_duration(duration)} for group_id, duration in entry.items()}
+        for goal_id, entry in log.items() if PATTERN_GOAL_ID.fullmatch(goal_id)
+    }
+
+
+def load_history(path_working: str,
+                 exclude: str) -> list[dict]:
+    """
+    Reads the resource usage recorded by the previous runs from the logs of the working directory. The durations of
+    the logs without resource usage are derived from their StageLogger entries.
+    :param path_working: the working directory
+    :param exclude: the file name of the log of the current run
+    :return: the resource usage of the jobs per run, grouped by the formatted goal IDs
+    """
+    history = []
+    for name in sorted(os.listdir(path_working)):
+        if name.startswith("log-") and name.endswith(".json") and name != exclude:
+            try:
+                with open(os.path.join(path_working, name)) as file:
+                    log = json.load(file)
+                history.append(log[RESOURCES] if log.get(RESOURCES) else stage_durations(log))
+            except (OSError, ValueError, TypeError, AttributeError):
+                continue
+    return history
+
+
+class CostModel:
+    """
+    Predicts the duration of jobs from the durations recorded in previous runs. A known (goal type, group) pair is
+    predicted by the median of its durations. An unseen pair is predicted by the number of shapes of the group
+    multiplied by the cost of a single shape in the goal type, where both of them are known, then by the mean
+    duration of the groups of the goal type, and finally by the mean duration of all the groups.
+    The number of shapes of a group is derived from the number of files that a non-packed job produced.
+    """
+
+    def __init__(self, history: list[dict]):
+        """
+        :param history: the resource usage of the jobs per run, grouped by the formatted goal IDs
+        """
+        samples = dict()
+        self.shapes = dict()
+        for resources in history:
+            for goal_id, jobs in resources.items():
+                goal_type = goal_id.split("-", 1)[1]
+                for group_id, usage in jobs.items():
+                    if "duration" not in usage:
+                        continue
+                    samples.setdefault((goal_type, group_id), []).append(usage["duration"])
+                    files, per_shape = usage.get("files", 0), FILES_PER_SHAPE.get(goal_type)
+                    if per_shape and files > 0 and files % per_shape == 0:
+                        self.shapes[group_id] = files // per_shape
+
+        self.durations = {key: statistics.median(values) for key, values in samples.items()}
+        self.per_group, self.per_shape = dict(), dict()
+        for goal_type in {goal_type for goal_type, _ in self.durations}:
+            durations = {group_id: duration for (key, group_id), duration in self.durations.items()
+                         if key == goal_type}
+            self.per_group[goal_type] = statistics.mean(durations.values())
+            counted = [group_id for group_id in durations if group_id in self.shapes]
+            if counted:
+                self.per_shape[goal_type] = sum(durations[group_id] for group_id in counted) / \
+                                            sum(self.shapes[group_id] for group_id in counted)
+        self.overall = statistics.mean(self.durations.values()) if self.durations else None
+
+    def predict(self,
+                goal_type: str,
+                group_id: str) -> tuple[Optional[float], Optional[str]]:
+        """
+        Predicts the duration of a job.
+        :param goal_type: the type of the goal
+        :param group_id: the formatted ID of the group
+        :return: the predicted duration in seconds and its basis, or None twice if there is no history at all
+        """
+        if (goal_type, group_id) in self.durations:
+            return self.durations[(goal_type, group_id)], BASIS_HISTORY
+        if goal_type in self.per_shape and group_id in self.shapes:
+            return self.per_shape[goal_type] * self.shapes[group_id], BASIS_SHAPES
+        if goal_type in self.per_group:
+            return self.per_group[goal_type], BASIS_GOAL_TYPE
+        if self.overall is not None:
+            return self.overall, BASIS_ANY
+        return None, None
+
+
+def order_jobs(jobs: list[Job]) -> list[Job]:
+    """
+    Orders the jobs by their predicted durations in a descending order (longest processing time first).
+    Jobs without a prediction keep their configured order at the end.
+    :param jobs: the jobs
+    :return: the ordered jobs
+    """
+    return sorted(jobs, key=lambda job: -(job.predicted or 0))
+
+
+def ready_jobs(pending: list[Job],
+               finished: set[int]) -> list[Job]:
+    """
+    Selects the pending jobs whose required jobs have finished.
+    :param pending: the pending jobs in the order of their priority
+    :param finished: the IDs (id()) of the finished jobs
+    :return: the ready jobs in the order of their priority
+    """
+    return [job for job in pending if all(id(required) in finished for required in job.requires)]
+
+
+def simulate_schedule(jobs: list[Job],
+                      workers: int) -> tuple[float, list[Job]]:
+    """
+    Simulates a list schedule with the predicted durations, in which each idle worker starts the first ready job.
+    Jobs without a prediction are taken as instantaneous.
+    :param jobs: the jobs in the order of their priority
+    :param workers: the number of workers
+    :return: the makespan and the jobs in the order of their start
+    """
+    pending, running, finished, started = list(jobs), [], set(), []
+    now = 0.0
+    while pending or running:
+        for job in ready_jobs(pending, finished)[:workers - len(running)]:
+            pending.remove(job)
+            heapq.heappush(running, (now + (job.predicted or 0), len(started), job))
+            started.append(job)
+        now, _, job = heapq.heappop(running)
+        finished.add(id(job))
+    return now, started
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """
+    Formats a duration as hours, minutes and seconds.
+    :param seconds: the duration in seconds
+    :return: the formatted duration, or "?" if it is unknown
+    """
+    return "?" if seconds is None else str(timedelta(seconds=round(seconds)))
+
+
+async def call_async(command: list[str],
+                     env: Optional[dict] = None) -> dict:
     process = await asyncio.create_subprocess_exec(
-        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, env=env
     )
+    usage = dict()
+    sampler = asyncio.create_task(sample_usage(process.pid, usage))
 
     async def output_filter(
             input_stream: streams.StreamReader,
@@ -37,6 +382,8 @@ async def call_async(command: list[str]) -> None:
         output_filter(process.stdout, sys.stdout),
     )
     await process.wait()
+    sampler.cancel()
+    return usage
 
 
 def main() -> None:
@@ -48,59 +395,160 @@ def main() -> None:
     blender_executable = os.path.join(conf["blender-base"], f"Blender {blender_version}", "blender")
     blender_project = conf["blender-project"]
     path_working = conf["working-directory"]
-    path_internal_runner = os.path.join(
-        conf["blender-base"], f"Blender {blender_version}", blender_version, "scripts", "modules", "viskillz",
-        "blender", "runner.py"
+    path_modules = os.path.join(
+        conf["blender-base"], f"Blender {blender_version}", blender_version, "scripts", "modules"
     )
+    path_internal_runner = os.path.join(path_modules, "viskillz", "blender", "runner.py")
+    workers = conf.get(WORKERS, 1)
+    if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+        raise ValueError(f"Property {WORKERS} must be a positive integer, got: {workers!r}.")
+    workers_offline = 0 if workers == 1 else max(1, (os.cpu_count() or 1) // workers)
 
     start_time = datetime.now().strftime("%Y%m%d-%H%M%S")
-    global_log = dict()
+    name_log = f"log-{name_conf}-{start_time}.json"
+    global_log = {RESOURCES: dict(), SUMMARY: dict(), SCHEDULE: dict()}
 
     command_base = [blender_executable, "--background", blender_project, "--python", path_internal_runner, "--"]
+    command_base_offline = [sys.executable, "-m", "viskillz.offline.runner"]
+    env_offline = {**os.environ, "PYTHONPATH": path_modules}
+    jobs = []
+    outputs = dict()
 
-    def run_command(group_ids: list[str], path_out: str, args: Callable, is_async: bool = False) -> dict:
-        init_dir(os.path.join(path_working, path_out), delete=False)
-        for group_id in group_ids:
-            formatted_group_id = f"Classic.{str(group_id).zfill(2)}"
-            init_dir(os.path.join(path_working, path_out, formatted_group_id), delete=False)
-
-        logger = StageLogger(lambda x: x, 0)
+    def producers(path: str, group_ids: Optional[list[str]] = None) -> list[Job]:
+        jobs_out = outputs.get(os.path.normpath(os.path.join(path_working, path)), dict())
+        return [job for group_id, job in jobs_out.items() if group_ids is None or group_id in group_ids]
 
+    def add_jobs(goal_id: str, goal_type: str, group_ids: list[str], path_out: str, args: Callable,
+                 is_async: bool = False, offline: bool = False, inputs: Optional[list[str]] = None,
+                 requires: Optional[list[Job]] = None) -> None:
+        init_dir(os.path.join(path_working, path_out), delete=False)
         for group_id in group_ids:
             formatted_group_id = f"Classic.{str(group_id).zfill(2)}"
             path_output_group = os.path.join(path_working, path_out, formatted_group_id)
-            logger.start(formatted_group_id)
+            init_dir(path_output_group, delete=False)
 
-            command = command_base + args(**{"path_out": path_output_group, "group_id": formatted_group_id})
-            asyncio.run(call_async(command)) if is_async else subprocess.call(command)
-        return logger.finish()
+            command = (command_base_offline if offline else command_base) + \
+                args(**{"path_out": path_output_group, "group_id": formatted_group_id})
+            jobs.append(Job(goal_id, goal_type, formatted_group_id, command, path_output_group, is_async,
+                            env_offline if offline else None, (requires or []) + [
+                                job for path in inputs or [] for job in producers(path, [formatted_group_id])
+                            ]))
 
     for goal_id in range(len(conf["goals"])):
         goal = conf["goals"][goal_id]
-        print(f"#{goal_id} / {len(conf['goals'])}", goal[TYPE])
+        count = len(jobs)
+        args_packed = ["-pack"] if goal.get(PACKED, False) else []
+        offline = goal.get(BACKEND) == BACKEND_SNAPSHOT
+        args_offline = [
+            "-snapshot", os.path.join(path_working, goal[SNAPSHOT]), "-workers", str(goal.get(WORKERS, workers_offline))
+        ] if offline else []
+        requires_snapshot = producers(goal[SNAPSHOT]) if offline else []
 
         formatted_goal_id = f"{str(goal_id).zfill(2)}-{goal[TYPE]}"
-        global_log[formatted_goal_id] = run_command(goal[GROUPS], goal[OUT], *{
-            "scenarios-3d": [
-                lambda **kwargs: [
-                    "-3d", kwargs["path_out"], kwargs["group_id"]
-                ], True
-            ],
-            "scenarios-2d": [
-                lambda **kwargs: [
-                    "-2d", kwargs["path_out"], kwargs["group_id"], str(goal["camera"])
-                ], True
-            ],
-            "intersections": [
-                lambda **kwargs: [
-                    "-ans", kwargs["path_out"], kwargs["group_id"]
-                ], True
-            ]
-        }[goal[TYPE]])
-
-        with open(os.path.join(path_working, f"log-{name_conf}-{start_time}.json"), "w") as file:
+        if goal.get(PROFILE, PROFILE_DEFAULT) not in PROFILES:
+            raise ValueError(f"Goal #{goal_id}: unknown profile {goal[PROFILE]!r}, expected one of {PROFILES}.")
+        if offline and goal[TYPE] == "scenarios-3d" and goal.get(PROFILE, PROFILE_DEFAULT) != PROFILE_COMPACT:
+            raise ValueError(f"Goal #{goal_id}: backend {BACKEND_SNAPSHOT} supports only profile compact.")
+        if goal[TYPE] == "snapshot":
+            path_snapshot = os.path.join(path_working, goal[OUT])
+            jobs.append(Job(formatted_goal_id, goal[TYPE], goal[OUT], command_base + ["-snap", path_snapshot],
+                            path_snapshot, False))
+        elif goal[TYPE] == "similarity":
+            path_index = os.path.join(path_working, goal[OUT])
+            group_ids = [f"Classic.{str(group_id).zfill(2)}" for group_id in goal[GROUPS]]
+            jobs.append(Job(formatted_goal_id, goal[TYPE], goal[OUT], command_base_offline + [
+                "-sim", os.path.join(path_working, goal[SRC]), path_index, "-groups", ",".join(group_ids),
+                "-workers", str(goal.get(WORKERS, workers_offline))
+            ], path_index, False, env_offline, producers(goal[SRC], group_ids)))
+        else:
+            add_jobs(formatted_goal_id, goal[TYPE], goal[GROUPS], goal[OUT], *{
+                "scenarios-3d": [
+                    lambda **kwargs: [
+                        "-3d", kwargs["path_out"], kwargs["group_id"], *args_packed,
+                        "-profile", goal.get(PROFILE, PROFILE_DEFAULT), *args_offline
+                    ], not offline, offline, [], requires_snapshot
+                ],
+                "scenarios-2d": [
+                    lambda **kwargs: [
+                        "-2d", kwargs["path_out"], kwargs["group_id"], str(goal["camera"]), *args_packed
+                    ], True
+                ],
+                "compact-2d": [
+                    lambda **kwargs: [
+                        "-svg", os.path.join(path_working, goal[SRC], kwargs["group_id"]), kwargs["path_out"],
+                        kwargs["group_id"], "-workers", str(goal.get(WORKERS, workers_offline)),
+                        "-decimals", str(goal.get(DECIMALS, 1)), *([] if goal.get(VERIFY, True) else ["-noverify"])
+                    ], False, True, [goal[SRC]] if SRC in goal else []
+                ],
+                "intersections": [
+                    lambda **kwargs: [
+                        "-ans", kwargs["path_out"], kwargs["group_id"], *args_offline,
+                        *(["-verify"] if goal.get(VERIFY, False) and not offline else []),
+                        *(["-reference", os.path.join(path_working, goal[REFERENCE], kwargs["group_id"])]
+                          if offline and REFERENCE in goal else [])
+                    ], not offline, offline, [goal[REFERENCE]] if offline and REFERENCE in goal else [],
+                    requires_snapshot
+                ]
+            }[goal[TYPE]])
+        outputs[os.path.normpath(os.path.join(path_working, goal[OUT]))] = {job.group_id: job for job in jobs[count:]}
+
+    model = CostModel(load_history(path_working, name_log))
+    for job in jobs:
+        job.predicted, job.basis = model.predict(job.goal_type, job.group_id)
+    jobs = order_jobs(jobs)
+
+    predicted, planned = simulate_schedule(jobs, workers)
+    unknown = sum(job.predicted is None for job in jobs)
+    for job in planned:
+        print(f"{job.goal_id:<24} {job.group_id:<16} {format_duration(job.predicted):>10} {job.basis or '-'}")
+    print(f"Predicted makespan with {workers} worker(s): {format_duration(predicted)}"
+          + (f" (without {unknown} job(s) having no history)" if unknown else ""))
+
+    schedule = global_log[SCHEDULE]
+    schedule.update({"workers": workers, "predicted_makespan": predicted, "jobs": []})
+
+    def write_log() -> None:
+        global_log[SUMMARY] = summarize_usage(global_log[RESOURCES])
+        with open(os.path.join(path_working, name_log), "w") as file:
             json.dump(global_log, file, indent=2)
 
+    def start_job(index: int, job: Job) -> tuple[dict, dict]:
+        print(f"#{index} / {len(jobs)}", job.goal_id, job.group_id)
+        logger = StageLogger(lambda x: x, 0)
+        logger.start(job.group_id)
+        usage = run_job(job.command, job.path_out, job.is_async, job.env)
+        return usage, logger.finish()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending, running, finished = list(jobs), dict(), set()
+        while pending or running:
+            for job in ready_jobs(pending, finished)[:workers - len(running)]:
+                pending.remove(job)
+                running[executor.submit(start_job, len(finished) + len(running), job)] = job
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                usage, timing = future.result()
+                finished.add(id(job))
+                global_log[RESOURCES].setdefault(job.goal_id, dict())[job.group_id] = usage
+                global_log.setdefault(job.goal_id, dict())[job.group_id] = timing[job.group_id]
+                schedule["jobs"].append({
+                    "goal": job.goal_id, "group": job.group_id, "predicted": job.predicted, "basis": job.basis,
+                    "actual": usage["duration"]
+                })
+                write_log()
+
+    schedule["actual_makespan"] = time.perf_counter() - start
+    write_log()
+
+    print(f"{'goal':<24} {'group':<16} {'predicted':>10} {'actual':>10} {'error':>8}")
+    for entry in schedule["jobs"]:
+        error = "-" if not entry["predicted"] else f"{entry['actual'] / entry['predicted'] - 1:+.0%}"
+        print(f"{entry['goal']:<24} {entry['group']:<16} {format_duration(entry['predicted']):>10} "
+              f"{format_duration(entry['actual']):>10} {error:>8}")
+    print(f"Makespan: predicted {format_duration(predicted)}, actual {format_duration(schedule['actual_makespan'])}")
+
 
 if __name__ == "__main__":
     with keepawake(keep_screen_awake=True):